@@ -115,8 +115,9 @@ class AssetLoader:
     def sprite(self, category: EntityCategory, name: EntityType, state: EntityState, direction: Direction, frame: int) -> pygame.Surface | None:
         return self.entities.get_sprite(category, name, state, direction, frame)
 
-    def autotile(self, tileset_key:str, layout:MarchingLayout, neighbors: list[bool]) -> pygame.Surface:
-        return self.tiles.build_marching_tile(tileset_key, layout, neighbors)
+    def autotile(self, tileset_key:str, layout:MarchingLayout, mask: int, 
+                 seed: int = 0, grid_pos: tuple[int, int] = (0, 0)) -> pygame.Surface:
+        return self.tiles.build_marching_tile(tileset_key, layout, mask, seed, grid_pos)
 
     def load_image(self, filename: str, scale=None) -> pygame.Surface:            
         return self.images.get_image(filename, scale)
@@ -5,7 +5,6 @@ from settings import (
     SLOT_FONT_SIZE, SLOT_FONT_BOLD
 )
 from dataclasses import dataclass, field
-import random
 
 CROPS_ORDER = [
     "Beet", "Onion", "Cabbage", "Squash", "Cauliflower", "Melon",
@@ -118,6 +117,8 @@ COLOURS: dict[str, str] = {
     "TILLED":         "#421F13",
     "PLANTED":        "#46641E",
     "WATER":          "#38DCF5",
+    "WATERED":        "#1E0F0A50", # Darkens wet soil
+    "NIGHT":          "#0A0A32B4", # Tint over the world at midnight (alpha scales with the night)
     "SEED":           "#009600",
     
     # Shop
@@ -172,11 +173,48 @@ class MarchingLayout:
                     
             self.mapping[mask] = cleaned_variants
 
-    def get_variant(self, mask: int, fallback_mask: int = 0) -> tuple[int, int, int]:
-        """Returns a random (row, col, rotation) for the given mask."""
+    def get_variants(self, mask: int, fallback_mask: int = 0) -> list[tuple[int, int, int]]:
+        """Returns every (row, col, rotation) option for the given mask."""
         # Try the requested mask. If missing, try the fallback mask (usually 0).
-        variants = self.mapping.get(mask, self.mapping.get(fallback_mask, [(0, 0, 0)]))
-        return random.choice(variants)
+        return self.mapping.get(mask, self.mapping.get(fallback_mask, [(0, 0, 0)]))
+
+    def get_variant_index(self, mask: int, seed: int, grid_x: int, grid_y: int, quad: int) -> int:
+        """Picks a variant as a pure function of the world seed, tile, quad and mask,
+            so the same tile always redraws with the same look."""
+        return self.variant_hash(seed, grid_x, grid_y, quad, mask) % len(self.get_variants(mask))
+
+    def get_variant(self, mask: int, seed: int = 0, grid_x: int = 0, grid_y: int = 0, quad: int = 0) -> tuple[int, int, int]:
+        """Returns the deterministic (row, col, rotation) for the given mask."""
+        return self.get_variants(mask)[self.get_variant_index(mask, seed, grid_x, grid_y, quad)]
+
+    @staticmethod
+    def variant_hash(*values: int) -> int:
+        """Stable 32-bit hash of a few integers (Python's hash() is salted per process)."""
+        h = 0x811C9DC5
+        for value in values:
+            # FNV-1a step per value...
+            h = ((h ^ (int(value) & 0xFFFFFFFF)) * 0x01000193) & 0xFFFFFFFF
+        # ...then a murmur3 finaliser so neighbouring tiles don't pick neighbouring variants
+        h ^= h >> 16
+        h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+        h ^= h >> 13
+        h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+        h ^= h >> 16
+        return h
+
+def _build_quad_masks() -> list[tuple[int, int, int, int]]:
+    """Splits every 9-bit node mask into the 4-bit masks of its NW, NE, SW and SE quads.
+        Node bits run left-to-right, top-to-bottom (bit 0 = top-left, bit 8 = bottom-right)."""
+    # The 4 nodes (top-left, top-right, bottom-left, bottom-right) touching each quad
+    quad_nodes = [(0, 1, 3, 4), (1, 2, 4, 5), (3, 4, 6, 7), (4, 5, 7, 8)]
+    table = []
+    for mask in range(512):
+        table.append(tuple(
+            sum(((mask >> node) & 1) << corner for corner, node in enumerate(nodes)) 
+            for nodes in quad_nodes))
+    return table
+
+QUAD_MASKS = _build_quad_masks()
 
 LAYOUT = MarchingLayout({
     # 1-Sided Corners
@@ -232,4 +270,7 @@ COBBLE_LAYOUT = MarchingLayout({
 
     # 4. Negative Mappings (L-Shapes)
     14: (1, 4), 13: (1, 3), 11: (0, 4), 7: (0, 3),
-})
\ No newline at end of file
+})
+
+# Every layout the autotiler can be asked for. TileGroup pre-rotates their sub-tiles at load.
+MARCHING_LAYOUTS = [LAYOUT, COBBLE_LAYOUT]
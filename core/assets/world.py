@@ -1,5 +1,6 @@
 from __future__ import annotations
 import pygame
+from collections import OrderedDict
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Sequence
 
@@ -10,7 +11,7 @@ from core.debug_logger import Log
 from core.assets.asset_data import (
     CROPS_ORDER, TREES_ORDER, GROUND_TILE_REGIONS, TILE_DETAILS, 
     MATERIAL_LEVELS, TOOL_SPRITE_LAYOUT, TREE_FRAME_SLICES, 
-    PLANT_FRAME_ORDER, FRUIT_RANKS, SEED_BAGS_POS,
+    PLANT_FRAME_ORDER, FRUIT_RANKS, SEED_BAGS_POS, MARCHING_LAYOUTS, QUAD_MASKS,
     MarchingLayout, Quality)
 from settings import BLOCK_SIZE, QUAD_SIZE
 from core.assets.base import SpriteGroup
@@ -19,7 +20,18 @@ from core.assets.base import SpriteGroup
 if TYPE_CHECKING:
     from core.assets import AssetLoader
 
-class TileGroup(SpriteGroup):    
+class TileGroup(SpriteGroup):
+    CACHE_LIMIT:int = 4096 # 512 neighbour patterns, with room for several variants each
+
+    def __init__(self, manager: AssetLoader, **sheet_files: str) -> None:
+        super().__init__(manager, **sheet_files)
+        # Finished autotiles keyed by (tileset, layout, 9-bit mask, quad variants)
+        self.autotile_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.cache_hits:int = 0
+        self.cache_misses:int = 0
+        # Sub-tiles for every (index, rotation) a layout references, built once in load()
+        self.atlas: dict[str, dict[tuple[int, int], pygame.Surface]] = {}
+
     def load(self) -> None:
         marching_sets = {
             "GRASS_A": ("grass_a", 160, 48),
@@ -33,6 +45,7 @@ class TileGroup(SpriteGroup):
                 self.storage[key] = sheet.extract_tiles_by_dimensions(
                     0, 0, w, h, 16, 16, self.SCALE_FACTOR
                 )
+                self._build_atlas(key)
         
         # 2. Dirt Fallback
         dirt_tiles = self.storage.get("DIRT")
@@ -53,37 +66,86 @@ class TileGroup(SpriteGroup):
                     )
                     self.storage[storage_key].extend(tiles)
 
-    def build_marching_tile(self, tileset_key:str, layout:MarchingLayout, neighbors: list[bool], sheet_width=10) -> pygame.Surface:
-        """Dynamically builds a 64x64 surface based on the 9-node neighborhood."""
-        surface = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE), pygame.SRCALPHA)
+    def _build_atlas(self, tileset_key: str, sheet_width=10) -> None:
+        """Pre-rotates every sub-tile the registered layouts can ask for, 
+            so compositing never has to call pygame.transform.rotate."""
+        tileset: list[pygame.Surface] = self.storage.get(tileset_key, [])
+        atlas: dict[tuple[int, int], pygame.Surface] = {}
+        
+        for layout in MARCHING_LAYOUTS:
+            for variants in layout.mapping.values():
+                for row, col, rotation in variants:
+                    index = row * sheet_width + col
+                    if (index, rotation) in atlas or index >= len(tileset):
+                        continue
+                    sub_tile = tileset[index]
+                    atlas[(index, rotation)] = pygame.transform.rotate(sub_tile, rotation) if rotation else sub_tile
+                    
+        self.atlas[tileset_key] = atlas
+
+    def build_marching_tile(self, tileset_key:str, layout:MarchingLayout, mask: int, 
+                            seed: int = 0, grid_pos: tuple[int, int] = (0, 0), sheet_width=10) -> pygame.Surface:
+        """Returns a 64x64 surface for a 9-bit node mask (bit 0 = top-left node, bit 8 = bottom-right).
+            Variants are derived from (seed, grid_pos), so a tile always rebuilds identically.
+            Composited tiles are cached and shared, so callers must blit them rather than draw onto them."""
         tileset: list[pygame.Surface] | None = self.storage.get(tileset_key)
         
         # Fallback if tileset is missing
         if not tileset:
+            surface = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE), pygame.SRCALPHA)
             surface.fill(self.manager.colours.get_colour("DEFAULT"))
             return surface
 
-        quads = [
-            (neighbors[0], neighbors[1], neighbors[3], neighbors[4]), # NW
-            (neighbors[1], neighbors[2], neighbors[4], neighbors[5]), # NE
-            (neighbors[3], neighbors[4], neighbors[6], neighbors[7]), # SW
-            (neighbors[4], neighbors[5], neighbors[7], neighbors[8]), # SE
-        ]
+        # NW, NE, SW, SE
+        quad_masks = QUAD_MASKS[mask]
+
+        # Pick the variant for each quad up front, so the finished tile can be looked up
+        grid_x, grid_y = grid_pos
+        variant_lists = [layout.get_variants(quad_mask) for quad_mask in quad_masks]
+        picks = tuple(layout.get_variant_index(quad_mask, seed, grid_x, grid_y, quad) 
+                      for quad, quad_mask in enumerate(quad_masks))
+
+        cache_key = (tileset_key, id(layout), mask, picks)
+        
+        cached = self.autotile_cache.get(cache_key)
+        if cached is not None:
+            self.cache_hits += 1
+            self.autotile_cache.move_to_end(cache_key)
+            return cached
+        self.cache_misses += 1
+
+        surface = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE), pygame.SRCALPHA)
         blit_pos = [(0, 0), (QUAD_SIZE, 0), (0, QUAD_SIZE), (QUAD_SIZE, QUAD_SIZE)]
+        atlas = self.atlas.setdefault(tileset_key, {})
 
-        for i, inputs in enumerate(quads):
-            mask = (inputs[0]*1) + (inputs[1]*2) + (inputs[2]*4) + (inputs[3]*8)
-            row, col, rotation = layout.get_variant(mask)
+        for i, (variants, pick) in enumerate(zip(variant_lists, picks)):
+            row, col, rotation = variants[pick]
             
             index = row * sheet_width + col
-            sub_tile = tileset[index]
-
-            if rotation != 0:
-                sub_tile = pygame.transform.rotate(sub_tile, rotation)
+            sub_tile = atlas.get((index, rotation))
+            
+            # Layouts that weren't registered in MARCHING_LAYOUTS get rotated once, then remembered
+            if sub_tile is None:
+                sub_tile = tileset[index]
+                if rotation != 0:
+                    sub_tile = pygame.transform.rotate(sub_tile, rotation)
+                atlas[(index, rotation)] = sub_tile
 
             surface.blit(sub_tile, blit_pos[i])
+
+        # Evict the least recently used tile once the cache is full
+        self.autotile_cache[cache_key] = surface
+        if len(self.autotile_cache) > self.CACHE_LIMIT:
+            self.autotile_cache.popitem(last=False)
             
         return surface
+
+    def debug_print(self) -> None:
+        super().debug_print()
+        lookups = self.cache_hits + self.cache_misses
+        hit_rate = (self.cache_hits / lookups * 100) if lookups else 0.0
+        Log.info(f" Autotile Cache: {len(self.autotile_cache)}/{self.CACHE_LIMIT} tiles | "
+                 f"Hits: {self.cache_hits} | Misses: {self.cache_misses} | Hit Rate: {hit_rate:.1f}%")
     
 class ToolGroup(SpriteGroup):
     ITEM_SIZE:int = 36
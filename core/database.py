@@ -1,7 +1,7 @@
 from __future__ import annotations
 import sqlite3
 import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
 
 # Runtime Imports: These are needed to instantiate the data objects
 from core.types import ItemData, ItemCategory, ToolType, PlantData, ShopData, SpriteRect
@@ -58,6 +58,13 @@ class DatabaseManager:
         query = f"INSERT OR REPLACE INTO {table_name} ({columns}) VALUES ({placeholders})"
         self.cursor.execute(query, values)
 
+    def insert_records(self, table_name: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+        """ Batched INSERT OR REPLACE: one prepared statement run over every row with executemany.
+            Wrap calls in 'with self.conn:' to write them all in a single transaction. """
+        placeholders = ", ".join(["?"] * len(columns))
+        query = f"INSERT OR REPLACE INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        self.cursor.executemany(query, rows)
+
     def setup_tables(self) -> None:
         """Dynamically generates and executes all SQL schema queries."""
         
@@ -1,4 +1,5 @@
 from core.states.base import GameState, BaseUIState, STATE_REGISTRY
 from core.states.playing import PlayingState
+from core.states.loading import LoadingState
 from core.states.menus import MenuState, ShopState, CharacterSelectState, SettingsState
 from core.states.hud import HUD
\ No newline at end of file
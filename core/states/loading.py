@@ -0,0 +1,104 @@
+from __future__ import annotations
+import random
+import time
+from typing import TYPE_CHECKING
+import pygame
+
+# Runtime Imports (Essential for logic/inheritance)
+from settings import WIDTH, HEIGHT, CHUNK_SIZE, CHUNK_BAKES_PER_FRAME
+from core.assets import ASSETS
+from core.debug_logger import Log
+from core.states.base import GameState
+from core.states.playing import PlayingState
+from core.types import StateID, PlayerType
+from world.generation import WorldGenerationJob
+from world.level import Level
+
+# Type-Only Imports (Breaks circular loops)
+if TYPE_CHECKING:
+    from custom_types import Game
+    from world.chunk import ChunkKey
+    from world.save_file import SaveGame
+
+class LoadingState(GameState):
+    """ Shows a progress bar while the world is generated, then swaps to the PlayingState.
+    1. A WorldGenerationJob builds the node blocks and tile masks on a worker thread
+       (for a loaded save, on top of the tilled blocks it holds).
+    2. The PlayingState is built, and its on-screen chunks are baked a few per frame.
+    The window keeps responding the whole time, and the player only waits for what they can see. """
+    state_id = StateID.LOADING
+    BAR_SIZE = (400, 24)
+    GENERATION_SHARE = 0.75 # How much of the bar the worker's progress fills
+
+    def __init__(self, game: Game, character_type: PlayerType = PlayerType.RACOON, seed: int | None = None,
+                 save: SaveGame | None = None):
+        super().__init__(game)
+        self.character_type = character_type
+        self.start_time = time.perf_counter()
+
+        # Chunks saved at a different size can't be read back, so only the rest of the save is kept
+        if save and save.chunk_size != CHUNK_SIZE:
+            Log.error(f"Save uses {save.chunk_size}-tile chunks (now {CHUNK_SIZE}), so tilled ground is lost.")
+            save.chunks, save.chunk_size = {}, CHUNK_SIZE
+        self.save = save
+
+        if save:
+            self.job = WorldGenerationJob(save.seed, centre=Level.pixel_to_chunk(save.player_pos), saved_chunks=save.chunks)
+        else:
+            self.job = WorldGenerationJob(seed if seed is not None else random.randrange(2**32))
+        self.job.start()
+
+        self.playing: PlayingState | None = None
+        self.bake_queue: list[ChunkKey] = []
+        self.bake_total = 0
+
+        self.bar_rect = pygame.Rect((0, 0), self.BAR_SIZE)
+        self.bar_rect.center = (WIDTH // 2, HEIGHT // 2)
+
+    @property
+    def progress(self) -> float:
+        if self.playing is None:
+            return self.job.progress * self.GENERATION_SHARE
+        baked = 1 - len(self.bake_queue) / self.bake_total if self.bake_total else 1.0
+        return self.GENERATION_SHARE + baked * (1 - self.GENERATION_SHARE)
+
+    def update(self, dt: float, is_paused: bool = False) -> None:
+        # --- 1. Wait for the worker, then build the game on the main thread ---
+        if self.playing is None:
+            if not self.job.done:
+                return
+            
+            # If the worker failed, the Level simply generates the chunks itself
+            self.playing = PlayingState(self.game, self.character_type, seed=self.job.seed, 
+                                        prepared=self.job.result, save=self.save)
+            
+            camera = self.playing.all_sprites
+            camera.follow(self.playing.player)
+            self.bake_queue = self.playing.level.renderer.visible_chunks(camera.get_view_rect())
+            self.bake_total = len(self.bake_queue)
+            return
+
+        # --- 2. Bake the chunks the player will see first, a few per frame ---
+        renderer = self.playing.level.renderer
+        for key in self.bake_queue[:CHUNK_BAKES_PER_FRAME]:
+            renderer.bake_chunk(key)
+        del self.bake_queue[:CHUNK_BAKES_PER_FRAME]
+
+        if not self.bake_queue:
+            Log.success(f"World ready in {time.perf_counter() - self.start_time:.2f}s (seed: {self.job.seed})")
+            self.game.change(self.playing)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        screen.fill(ASSETS.colour("MenuBG"))
+
+        # Status text
+        status = "Generating world..." if self.playing is None else "Preparing tiles..."
+        text = ASSETS.config("HUD").render(status)
+        screen.blit(text, text.get_rect(midbottom=(self.bar_rect.centerx, self.bar_rect.top - 12)))
+
+        # Progress bar
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = round(self.bar_rect.width * self.progress)
+        pygame.draw.rect(screen, ASSETS.colour("ButtonBG"), self.bar_rect)
+        pygame.draw.rect(screen, ASSETS.colour("ButtonHover"), fill_rect)
+        pygame.draw.rect(screen, ASSETS.colour("ButtonBorder"), self.bar_rect, 2)
@@ -1,26 +1,38 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import time
 import pygame
 
 # Runtime Imports (Essential for logic/inheritance)
 from entities.player import Player
 from core.states.hud import HUD
-from world.level import Level
-from settings import WIDTH, HEIGHT
+from world.level import Level, HAS_NUMPY
+from world.collision import CollisionWorld
+from world.crop_field import CropField
+from world.game_clock import GameClock
+from settings import (WIDTH, HEIGHT, DEBUG, USE_CROP_FIELD, OFFLINE_SPEED, MINUTES_PER_DAY,
+                      DAY_START, GROWTH_INTERVAL)
 from core.assets import ASSETS
 from groups.camera import CameraGroup
 from groups.plant_group import PlantGroup
 from core.types import PlayerType
 from core.states.base import GameState
 from core.types import StateID
+from core.debug_logger import Log
+from world.save_file import SaveGame, SaveDelta, PlantRecord, InventorySlot
+from world.autosave import AutoSaver
+from entities.items import create_item
 
 # Type-Only Imports (Breaks circular loops)
 if TYPE_CHECKING:
     from custom_types import Game, Pos, PlayerType
+    from world.generation import PreparedWorld
+    from entities.plant import Plant
 
 class PlayingState(GameState):
     state_id = StateID.PLAYING
-    def __init__(self, game: Game, character_type: PlayerType = PlayerType.RACOON):
+    def __init__(self, game: Game, character_type: PlayerType = PlayerType.RACOON, 
+                 seed: int | None = None, prepared: PreparedWorld | None = None, save: SaveGame | None = None):
         super().__init__(game)
 
         self.transparent = False
@@ -29,35 +41,168 @@ class PlayingState(GameState):
         self.all_sprites = CameraGroup()
         self.plant_group = PlantGroup()
 
+        if save:
+            character_type = PlayerType(save.character)
         self.player = Player(WIDTH // 2, HEIGHT // 2, self.all_sprites, character_type)
         self.hud = HUD(self.game, self.player)
 
         self.level = Level(
             plant_group=self.plant_group,
             player_sprite=self.player,
-            map_data=None 
+            map_data=None,
+            seed=save.seed if save else seed,
+            prepared=prepared,
+            saved_chunks=save.chunks if save else None,
+            spawn_pos=save.player_pos if save else None
         )
+        self.world = CollisionWorld(self.level) # Everything the player can bump into or use
+        # Large farms live in arrays, with sprites only for the crops on screen
+        self.crop_field = CropField(self.level, self.all_sprites, self.world) if USE_CROP_FIELD and HAS_NUMPY else None
      
-        self.level.spawn_plant("apple", 5, 5, self.all_sprites)
-        self.level.spawn_plant("onion", 6, 5, self.all_sprites)
+        # In-game time drives the crops and the daily chores
+        self.clock = GameClock(save.clock_minutes if save else DAY_START)
+        self.clock.every(GROWTH_INTERVAL, self.grow_crops)
+        self.clock.every(MINUTES_PER_DAY, self.start_day, at=DAY_START)
+        self.night_overlay = pygame.Surface((WIDTH, HEIGHT))
+        self.night_overlay.fill(ASSETS.colour("NIGHT"))
+
+        if save:
+            self.restore_save(save)
+        else:
+            self.level.spawn_plant("apple", 5, 5, self.all_sprites, self.world)
+            self.level.spawn_plant("onion", 6, 5, self.all_sprites, self.world)
+
+        # Autosaves journal against the loaded save (a new game gets its first full save on the first autosave)
+        self.autosaver = AutoSaver(self.level.seed, generation=save.generation if save else None)
+        self.autosaver.start(self)
+        self.saved_player: tuple[int, int, int] | None = None
+        self.saved_growth_time: float | None = None
+        if save:
+            self.autosave_deltas() # Everything restored so far is already in the save
+            if save.saved_at:
+                self.catch_up(time.time() - save.saved_at)
 
         self.key_binds = {
             pygame.K_ESCAPE: self.game.quit,
+            pygame.K_F5: self.save_game,
             pygame.K_p: lambda: self.open_shop("general_store"),
-            pygame.K_SPACE: lambda: self.plant_group.grow_all(0.1)
+            pygame.K_SPACE: lambda: self.plant_group.grow_all(0.1),
+            pygame.K_COMMA: lambda: self.clock.change_speed(-1),
+            pygame.K_PERIOD: lambda: self.clock.change_speed(1)
         }
 
+    # --- GAME CLOCK ---
+    def grow_crops(self, minutes: float) -> None:
+        self.plant_group.grow_all(minutes / MINUTES_PER_DAY)
+
+    def start_day(self, minutes: float) -> None:
+        """Each morning the soil dries out."""
+        dried = self.level.dry_soil()
+        Log.info(f"Day {self.clock.day + 1} begins ({dried} chunks of soil dried out).")
+
+    # --- SAVING ---
+    def restore_save(self, save: SaveGame) -> None:
+        """Puts back everything the seed can't rebuild (the tilled chunks are restored by the Level)."""
+        self.player.money = save.money
+        self.plant_group.growth_time = save.growth_time
+        if self.crop_field is not None:
+            self.crop_field.load(save.plants) # Sprites are made as the crops come on screen
+        else:
+            for record in save.plants:
+                plant = self.level.spawn_plant(record.plant_id, record.grid_x, record.grid_y, self.all_sprites, self.world)
+                # Records may be older than the save's growth clock, so age them up to it
+                plant.age = record.age + (save.growth_time - record.synced_at)
+                plant.is_harvested = record.is_harvested
+                plant.update_visuals()
+
+        inventory = self.player.inventory.data
+        if save.inventory:
+            inventory.items = [None] * inventory.max_size
+        for slot in save.inventory:
+            if slot.index < inventory.max_size:
+                item = create_item(slot.item_id, slot.count)
+                item.water_level = slot.water_level if slot.water_level is not None else item.water_level
+                inventory.items[slot.index] = item
+
+    def catch_up(self, seconds: float) -> None:
+        """Runs the clock over real time that passed outside the game, in a single step: the crops grow once
+            for all of it, and a missed morning dries the soil once (see GameClock.advance)."""
+        minutes = max(seconds, 0.0) * GameClock.rate_at(OFFLINE_SPEED)
+        if minutes > 0:
+            self.clock.advance(minutes)
+        if minutes >= 1:
+            Log.info(f"{minutes / 60:.1f} game hours passed while the game was closed (now {self.clock}).")
+
+    def snapshot(self) -> SaveGame:
+        """A full save of the current session."""
+        return SaveGame(
+            seed=self.level.seed,
+            chunk_size=self.level.chunk_size,
+            player_pos=self.player.hitbox.center,
+            character=self.player.player_type.value,
+            money=self.player.money,
+            chunks=self.level.chunk_records(),
+            plants=self.plant_records(),
+            inventory=self.inventory_slots(),
+            growth_time=self.plant_group.growth_time,
+            saved_at=time.time(),
+            clock_minutes=self.clock.minutes
+        )
+
+    def autosave_deltas(self) -> SaveDelta:
+        """Everything that changed since the last call (the dirty chunks, plants and inventory)."""
+        delta = SaveDelta(
+            chunks=self.level.take_unsaved_chunks(),
+            plants=self.crop_field.take_unsaved() if self.crop_field is not None else
+                   [self.plant_record(plant) for plant in self.plant_group.take_unsaved()]
+        )
+        player = (*self.player.hitbox.center, self.player.money)
+        if player != self.saved_player:
+            delta.player = self.saved_player = player
+        if self.plant_group.growth_time != self.saved_growth_time:
+            delta.growth_time = self.saved_growth_time = self.plant_group.growth_time
+        if self.player.inventory.data.unsaved:
+            self.player.inventory.data.unsaved = False
+            delta.inventory = self.inventory_slots()
+        if delta:
+            delta.saved_at, delta.clock_minutes = time.time(), self.clock.minutes
+        return delta
+
+    def plant_record(self, plant: Plant) -> PlantRecord:
+        """Plants keep aging between autosaves, so the record notes the growth clock its age was read at."""
+        return PlantRecord(plant.plant_id, plant.grid_x, plant.grid_y, plant.age, plant.is_harvested,
+                           self.plant_group.growth_time)
+
+    def plant_records(self) -> list[PlantRecord]:
+        if self.crop_field is not None:
+            return self.crop_field.records()
+        return [self.plant_record(plant) for plant in self.plant_group.plants]
+
+    def inventory_slots(self) -> list[InventorySlot]:
+        return [InventorySlot(i, item.item_id, item.count, item.water_level)
+                for i, item in enumerate(self.player.inventory.data.items) if item]
+
+    def save_game(self) -> None:
+        """Queues a full save (written on the autosave thread)."""
+        self.autosave_deltas() # Already covered by the full save
+        self.autosaver.checkpoint(self.snapshot())
+
     def update(self, dt:float, is_paused: bool = False):
+        # dt is always one fixed simulation step (see Game.run)
+        self.player.store_previous_position()
+
         # Always update world animations (plants, water, etc.)
+        self.clock.update(dt)
         self.level.update(dt)
         
         # 3. Handle Player Logic (Only if not paused)
         if not is_paused:
-            # Gather everything the player can bump into or use
-            interactables = self.level.tile_list + self.plant_group.plants
-            
             # Explicitly update the player
-            self.player.update(dt, interactables)
+            self.player.update(dt, self.world)
+
+        if self.crop_field is not None:
+            self.all_sprites.follow(self.player)
+            self.crop_field.show(self.all_sprites.get_view_rect())
 
         # 4. Update the rest of the sprites (Excluding the player to avoid double-dip)
         for sprite in self.all_sprites:
@@ -69,21 +214,51 @@ class PlayingState(GameState):
         self.hud.update(dt, is_paused)
 
     def draw(self, screen: pygame.Surface) -> None:
+        # Move the camera first, so the map and entities are culled against the same view
+        alpha = self.game.alpha # Entities are drawn between the last two simulation steps
+        self.all_sprites.follow(self.player, alpha)
+        
         # Layer 1: The Water/Map
         screen.fill(ASSETS.colour("WATER"))
-        self.level.draw(self.all_sprites.offset)
+        self.level.draw(self.all_sprites.get_view_rect())
         
         # Layer 2: The Entities
-        self.all_sprites.custom_draw(self.player)
+        self.all_sprites.custom_draw(self.player, alpha)
         
-        # Layer 3: The HUD
+        # Layer 3: Night falls over the world (but not the HUD)
+        night = self.clock.night
+        if night > 0:
+            self.night_overlay.set_alpha(int(night * ASSETS.colour("NIGHT").a))
+            screen.blit(self.night_overlay, (0, 0))
+
+        # Layer 4: The HUD
         self.hud.draw(screen)
+        
+        if DEBUG:
+            self.draw_debug_overlay(screen)
+
+    def draw_debug_overlay(self, screen: pygame.Surface) -> None:
+        """Shows how much the camera culling is saving each frame."""
+        tiles, sprites = self.level.renderer, self.all_sprites
+        lines = [
+            f"Tiles: {tiles.drawn_count} drawn / {tiles.culled_count} culled",
+            f"Entities: {sprites.drawn_count} drawn / {sprites.culled_count} culled",
+            f"Tile surfaces: {len(tiles.surface_pool)} shared",
+            f"Chunks: {len(self.level.chunks)} loaded / {len(self.level.saved_chunks)} saved",
+            f"Autosave: {self.autosaver.flush_ms:.2f} ms / {self.autosaver.journal_bytes} B journal",
+            f"{self.clock} (x{self.clock.speed})",
+        ]
+        if self.crop_field is not None:
+            lines.append(f"Crops: {len(self.crop_field)} in field / {len(self.plant_group)} as sprites")
+        config = ASSETS.config("default")
+        for i, line in enumerate(lines):
+            text = config.render(line)
+            screen.blit(text, text.get_rect(topright=(WIDTH - 10, 10 + i * (text.get_height() + 2))))
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         if self.hud.handle_event(event):
             return True
-        collidables = self.level.tile_list + self.plant_group.plants
-        self.player.handle_event(event, collidables)
+        self.player.handle_event(event, self.world)
         return super().handle_event(event)
 
     def on_left_click(self,pos: Pos) -> None:
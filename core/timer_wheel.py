@@ -0,0 +1,149 @@
+from __future__ import annotations
+import math
+from typing import Callable
+
+TimerCallback = Callable[[float], None] # Called with the time since it last ran (or since it was scheduled)
+
+class TimerEntry:
+    """One scheduled callback. Keep it to cancel, pause or resume it (see TimerWheel)."""
+    __slots__ = ("callback", "interval", "due", "last_run", "remaining", "serial")
+
+    def __init__(self, callback: TimerCallback, interval: float | None, due: float, last_run: float) -> None:
+        self.callback = callback
+        self.interval = interval           # None = runs once
+        self.due = due
+        self.last_run = last_run
+        self.remaining: float | None = None # Time left while paused
+        self.serial = 0                    # Bumped on every reschedule, so stale slot entries can be skipped
+
+    @property
+    def paused(self) -> bool:
+        return self.remaining is not None
+
+class TimerWheel:
+    """ A hierarchical timing wheel: LEVELS rings of SLOTS buckets, each ring's buckets SLOTS times wider than the last.
+    A timer goes straight into the bucket for its due tick, in the finest ring that reaches it, and is only
+    moved down a ring when the wheel turns into its bucket. Scheduling and cancelling are O(1), and advancing
+    only touches the buckets passed and the timers that fire, so idle timers cost nothing.
+    Time is counted in whatever unit the owner advances it by (seconds for the UI, game minutes for the GameClock). """
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    LEVELS = 4
+
+    def __init__(self, tick: float) -> None:
+        self.tick = tick # Length of one bucket of the finest ring
+        self.now = 0.0
+        self.ticks = 0   # The last tick processed
+        self.rings: list[list[list[tuple[int, TimerEntry]]]] = [[[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self.overflow: list[tuple[int, TimerEntry]] = [] # Past the widest ring (rehashed when it wraps)
+        self.counts = [0] * self.LEVELS # Entries in each ring, including stale ones
+
+    # --- SCHEDULING ---
+    def after(self, delay: float, callback: TimerCallback) -> TimerEntry:
+        """Runs the callback once, `delay` from now."""
+        return self.schedule(TimerEntry(callback, None, self.now + delay, self.now))
+
+    def every(self, interval: float, callback: TimerCallback, first: float | None = None) -> TimerEntry:
+        """Runs the callback every `interval`, first at the time `first` (or one interval from now).
+            If it falls several intervals behind, it runs once and is told how much time has passed."""
+        return self.schedule(TimerEntry(callback, interval, self.now + interval if first is None else first, self.now))
+
+    def schedule(self, entry: TimerEntry) -> TimerEntry:
+        entry.serial += 1
+        entry.remaining = None
+        self._place(max(math.ceil(entry.due / self.tick), self.ticks + 1), entry)
+        return entry
+
+    def cancel(self, entry: TimerEntry) -> None:
+        entry.serial += 1 # Its bucket entry is now stale, and is dropped when the wheel reaches it
+
+    def pause(self, entry: TimerEntry) -> None:
+        """Stops the timer, keeping the time it had left."""
+        if not entry.paused:
+            self.cancel(entry)
+            entry.remaining = max(0.0, entry.due - self.now)
+
+    def resume(self, entry: TimerEntry) -> None:
+        if entry.paused:
+            entry.due = self.now + entry.remaining
+            self.schedule(entry)
+
+    # --- TIME ---
+    def update(self, dt: float) -> None:
+        self.advance(dt)
+
+    def advance(self, amount: float) -> None:
+        """Moves time forward, running every timer that comes due on the way, in order."""
+        self.now += amount
+        target = math.floor(self.now / self.tick)
+        rings, mask = self.rings, self.SLOTS - 1
+        while self.ticks < target:
+            # Jump over the stretch where no bucket fires or turns
+            tick = self.ticks = min(target, self._next_busy_tick())
+
+            # Turning into a new bucket of a wider ring moves its timers down (widest first)
+            for level in range(self.LEVELS - 1, 0, -1):
+                shift = self.SLOT_BITS * level
+                if tick & ((1 << shift) - 1) == 0:
+                    if level == self.LEVELS - 1 and (tick >> shift) & mask == 0:
+                        overflow, self.overflow = self.overflow, []
+                        self._rehash(overflow, None)
+                    bucket, rings[level][(tick >> shift) & mask] = rings[level][(tick >> shift) & mask], []
+                    self._rehash(bucket, level)
+
+            bucket, rings[0][tick & mask] = rings[0][tick & mask], []
+            self.counts[0] -= len(bucket)
+            for serial, entry in bucket:
+                if serial == entry.serial:
+                    self._fire(entry)
+
+    # --- PRIVATE HELPERS ---
+    def _fire(self, entry: TimerEntry) -> None:
+        elapsed = entry.due - entry.last_run
+        entry.last_run = entry.due
+        if entry.interval is not None:
+            # Skip any intervals that were missed, but still report the time that passed
+            missed = max(0.0, (self.now - entry.due) // entry.interval)
+            entry.last_run += missed * entry.interval
+            elapsed += missed * entry.interval
+            entry.due = entry.last_run + entry.interval
+            self.schedule(entry)
+        entry.callback(elapsed)
+
+    def _place(self, due_tick: int, entry: TimerEntry) -> None:
+        """Puts an entry in the finest ring whose current turn still reaches its due tick."""
+        for level in range(self.LEVELS):
+            shift = self.SLOT_BITS * (level + 1)
+            if due_tick >> shift == self.ticks >> shift:
+                self.rings[level][(due_tick >> (shift - self.SLOT_BITS)) & (self.SLOTS - 1)].append((entry.serial, entry))
+                self.counts[level] += 1
+                return
+        self.overflow.append((entry.serial, entry))
+
+    def _next_busy_tick(self) -> int | float:
+        """The first tick after now with a bucket to fire or move down (inf if nothing is scheduled).
+            A ring only holds buckets ahead of its current position, within its current turn."""
+        busy: int | float = math.inf
+        for level in range(self.LEVELS):
+            if not self.counts[level]:
+                continue
+            shift = self.SLOT_BITS * level
+            ring, position = self.rings[level], (self.ticks >> shift) & (self.SLOTS - 1)
+            for slot in range(position + 1, self.SLOTS):
+                if ring[slot]:
+                    turn = (self.ticks >> (shift + self.SLOT_BITS)) << (shift + self.SLOT_BITS)
+                    busy = min(busy, turn | (slot << shift))
+                    break
+        if self.overflow:
+            shift = self.SLOT_BITS * self.LEVELS
+            busy = min(busy, ((self.ticks >> shift) + 1) << shift)
+        return busy
+
+    def _rehash(self, bucket: list[tuple[int, TimerEntry]], level: int | None) -> None:
+        if level is not None:
+            self.counts[level] -= len(bucket)
+        for serial, entry in bucket:
+            if serial == entry.serial:
+                self._place(max(math.ceil(entry.due / self.tick), self.ticks), entry)
+
+TIMERS = TimerWheel(tick=0.01) # Real time in seconds, advanced by Game.run (UI timers, autosave)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import math
 import pygame
 from dataclasses import dataclass
 from typing import NamedTuple, TYPE_CHECKING, TypeVar, Generic
@@ -83,6 +84,25 @@ class PlantData:
         stage = int((current_age / self.grow_time) * 2)
         return min(stage, 1)
 
+    def age_after(self, current_age: float, elapsed: float) -> float:
+        """The age after any stretch of growth, in one step. Ripe crops wait for the player (a harvested
+            regrower starts again from 75%, see Plant.harvest), so there are never cycles to replay."""
+        return min(current_age + elapsed, self.grow_time)
+
+    def next_stage_age(self, current_age: float, is_harvested: bool = False) -> float | None:
+        """The age at which get_stage_index next changes, or None if it never will (mature or harvested)."""
+        stage = self.get_stage_index(current_age, is_harvested)
+        growing_stages = 4 if self.is_tree else 3 if self.regrows else 2
+        for step in range(1, growing_stages + 1):
+            threshold = self.grow_time * step / growing_stages
+            if threshold <= current_age:
+                continue
+            # The division in get_stage_index can land just short of a threshold, so also try the next float up
+            for age in (threshold, math.nextafter(threshold, math.inf)):
+                if self.get_stage_index(age, is_harvested) != stage:
+                    return age
+        return None
+
 @dataclass(frozen=True)
 class ShopData:
     store_name:str # Title show at top of store (e.g. General Store)
@@ -171,4 +191,8 @@ class StateStack(Generic[T]):
 
     def __len__(self):
         return len(self._stack)
+
+    def __iter__(self):
+        """Bottom to top."""
+        return iter(self._stack)
     
@@ -9,6 +9,7 @@ class StateID(Enum):
     CHAR_SELECT = auto()
     HUD = auto()
     SETTINGS = auto()
+    LOADING = auto()
 
 class EntityState(Enum):
     WALK = "Walk"
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, TypeAlias, Protocol, Any, Sequence
+from typing import TYPE_CHECKING, TypeAlias, Protocol, Any, Sequence, Union
 import pygame
 
 from entities.entity import Entity
@@ -9,11 +9,12 @@ from core.types import PlayerType, FarmAnimalType
 Num = int|float
 Group = pygame.sprite.AbstractGroup
 Pos = tuple[int,int]
-NodeMap = list[list[int]]
+NodeMap = Union[list[list[int]], "np.ndarray"] # 2D uint8 array when NumPy is available
 Interactables = Sequence[Tile | Entity]
 EntityType = PlayerType | FarmAnimalType | str
 Colour = str | tuple[int, int, int] | pygame.Color
 if TYPE_CHECKING:
+    import numpy as np
     from main import Game
     # Core Logic
     from entities.components.animation import AnimationController
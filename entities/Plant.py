@@ -14,6 +14,7 @@ from core.debug_logger import Log
 # Type-Only Imports
 if TYPE_CHECKING:
     from custom_types import Group
+    from groups.plant_group import PlantGroup
 
 class Plant(Entity):
     def __init__(self, plant_id: str, grid_x: int, grid_y: int, *groups:Group) -> None:
@@ -23,10 +24,14 @@ class Plant(Entity):
         # Get Logic Data (Growth time, is_tree, etc)
         self.data: PlantData = ASSETS.plant(plant_id)
         
-        # State
-        self.age:float = 0.0
+        # State (age is worked out from the grower's growth clock, see the age property)
+        self._age:float = 0.0           # Age when the grower's clock read _synced_at
+        self._synced_at:float = 0.0
+        self._is_harvested:bool = False
+        self.grower: PlantGroup | None = None # The group whose growth clock ages this plant
+        self.schedule_id:int = 0              # Bumped on every reschedule, so stale entries can be skipped
         self.days_old:int = 0
-        self.is_harvested:bool = False
+        self.stage:int = self.data.get_stage_index(0.0)
         
         # Make trees solid for collisions and set their hitbox scale to 50%
         self.obstructed = self.data.is_tree
@@ -53,15 +58,48 @@ class Plant(Entity):
     
     def _get_current_image(self) -> pygame.Surface:
         """Helper to generate the current stage key and fetch the image."""
-        image_key = f"{self.data.name}_{self.data.get_stage_index(self.age, self.is_harvested)}"
+        image_key = f"{self.data.name}_{self.stage}"
         return ASSETS.get_image(image_key)
+
+    # --- GROWTH STATE ---
+    @property
+    def age(self) -> float:
+        if self.grower is None:
+            return self._age
+        return self.data.age_after(self._age, self.grower.growth_time - self._synced_at)
+
+    @age.setter
+    def age(self, value: float) -> None:
+        self._age = value
+        self._synced_at = self.grower.growth_time if self.grower is not None else 0.0
+        self.reschedule()
+
+    @property
+    def is_harvested(self) -> bool:
+        return self._is_harvested
+
+    @is_harvested.setter
+    def is_harvested(self, value: bool) -> None:
+        self._is_harvested = value
+        self.reschedule()
+
+    def set_grower(self, grower: PlantGroup | None) -> None:
+        """Hands the plant's aging over to another growth clock (or freezes it with None), keeping its age."""
+        age = self.age
+        self.grower = grower
+        self.age = age
+
+    def reschedule(self) -> None:
+        """Lets the grower know when this plant will next change stage."""
+        self.schedule_id += 1
+        if self.grower is not None:
+            self.grower.schedule(self)
     
     def grow(self, amount: float) -> None:
         """ Call this to test the animation stages """
-        self.age += amount
-        if self.age > self.data.grow_time:
-            self.age = self.data.grow_time
+        self.age = min(self.age + amount, self.data.grow_time)
         
+        self.mark_unsaved()
         self.update_visuals()
 
     def harvest(self) -> Item|None:
@@ -79,11 +117,24 @@ class Plant(Entity):
                 # Single harvest crop permanently transitions to Frame 4 (Stump/Empty)
                 self.is_harvested = True
                 
+            self.mark_unsaved()
             self.update_visuals()
             return yielded_item
             
         return None
 
+    def mark_unsaved(self) -> None:
+        """Queues this plant for the next autosave, in any group that tracks it (see PlantGroup)."""
+        for group in self.groups():
+            if hasattr(group, "mark_unsaved"):
+                group.mark_unsaved(self)
+
+    def reindex(self) -> None:
+        """Re-buckets the plant in any group that keeps a spatial index (see CollisionWorld)."""
+        for group in self.groups():
+            if hasattr(group, "reindex"):
+                group.reindex(self)
+
     def on_interact(self, player: Player) -> bool:
         """ When player clicks on this plant with empty hand, ,try harvest it"""
         harvested_item = self.harvest()
@@ -102,11 +153,12 @@ class Plant(Entity):
     
     def update_visuals(self) -> None:
         """ Checks if the plant grew into a new stage and updates the sprite. """
-        new_image = self._get_current_image()
-        if new_image == self.image: 
-            return # Only update if the image changed
+        stage = self.data.get_stage_index(self.age, self.is_harvested)
+        if stage == self.stage:
+            return # Only update if the stage changed
         
-        self.image = new_image
+        self.stage = stage
+        self.image = self._get_current_image()
         # Trees are taller than seeds, so we must re-anchor the midbottom to the ground!
         bottom_anchor = self.hitbox.midbottom
         self.rect = self.image.get_rect()
@@ -117,4 +169,5 @@ class Plant(Entity):
         
         # Snap the newly sized visual rect back to the correctly placed hitbox
         self.sync_rect_to_hitbox()
+        self.reindex()
             
\ No newline at end of file
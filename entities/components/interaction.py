@@ -7,7 +7,7 @@ from core.controls import controls
 
 # Type-Only Imports
 if TYPE_CHECKING:
-    from custom_types import Interactables
+    from world.collision import CollisionWorld
     from world.tile import Tile
     from entities.entity import MovingEntity, Entity
     from core.types import Direction
@@ -28,7 +28,7 @@ class InteractionController:
             if dx == 0 or dy == 0:
                 self.offsets[direction] = pygame.math.Vector2(dx * self.distance, dy * self.distance)
 
-    def get_target_objects(self, interactables: Interactables) -> list[Tile | Entity]:
+    def get_target_objects(self, world: CollisionWorld) -> list[Tile | Entity]:
         """Casts a short 'ray' to find what the entity is looking at."""
         # Get the offset based on the entity's current facing direction
         offset = self.offsets.get(self.entity.facing, pygame.math.Vector2(0, 0))
@@ -36,8 +36,5 @@ class InteractionController:
         # Calculate the exact pixel point in the world
         target_point = self.entity.hitbox.midbottom + offset
         
-        # Create a 1x1 invisible rect at the target point
-        target_rect = pygame.Rect(int(target_point.x), int(target_point.y), 1, 1)
-        
-        # Return all solid and non-solid interactables that touch this point
-        return [obj for obj in interactables if target_rect.colliderect(obj.rect)]
\ No newline at end of file
+        # Look the point up by grid cell: the tile, its occupant, then anything else drawn over it
+        return world.objects_at((int(target_point.x), int(target_point.y)))
\ No newline at end of file
@@ -68,6 +68,7 @@ class InventoryController:
         item = self.get_active_item()
         if item and item.count <= 0:
             self.data.items[self.active_slot_index] = None
+            self.data.mark_unsaved()
             Log.info("Item consumed entirely.")
 
     def handle_event(self, event: pygame.event.Event, controls_map) -> None:
@@ -263,6 +264,7 @@ class InventoryManager:
             return
 
         target_item = target_ctrl.data.items[target_idx]
+        target_ctrl.data.mark_unsaved()
 
         # Try to Stack
         if target_item and drag_ctrl.cursor_item.name == target_item.name:
@@ -288,6 +290,7 @@ class InventoryManager:
             return
             
         ctrl, idx = drag_ctrl.drag_origin
+        ctrl.data.mark_unsaved()
         if ctrl.data.items[idx] is None:
             ctrl.data.items[idx] = drag_ctrl.cursor_item
         else:
@@ -1,19 +1,18 @@
 from __future__ import annotations
 import pygame
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from settings import WIDTH, HEIGHT
 from core.types import Direction, EntityState
 
 if TYPE_CHECKING:
-    from custom_types import Num, Group, Interactables
+    from custom_types import Num, Group
+    from world.collision import CollisionWorld
     from entities.player import Player
 
 class Entity(pygame.sprite.Sprite):
     """Absolute base class for anything that exists in the game world."""
     def __init__(self, image: pygame.Surface | None, initial_rect: pygame.Rect, 
                  initial_hitbox: pygame.Rect, *groups: Group, hitbox_offset: int = 10) -> None:
-        super().__init__(*groups)
         self.image = image
         
         self.rect = initial_rect
@@ -23,6 +22,9 @@ class Entity(pygame.sprite.Sprite):
         # Snap the visual rect to the hitbox exactly once on creation
         self.sync_rect_to_hitbox()
 
+        # Join the groups last, so groups that index by position (CollisionWorld) see where we are
+        super().__init__(*groups)
+
     def sync_rect_to_hitbox(self) -> None:
         """Aligns the visual sprite with the physics hitbox."""
         self.rect.centerx = self.hitbox.centerx
@@ -37,6 +39,10 @@ class Entity(pygame.sprite.Sprite):
         
         return pygame.Rect(0, 0, hb_width, hb_height)
     
+    def render_pos(self, alpha: float) -> tuple[int, int]:
+        """Where to draw the rect's top left (only moving entities are interpolated)."""
+        return self.rect.topleft
+
     def draw(self, surface: pygame.Surface, offset_x: Num = 0, offset_y: Num = 0) -> None:
         """Standard drawing logic."""
         if self.image is None: 
@@ -60,6 +66,7 @@ class MovingEntity(Entity):
         
         # Add movement-specific variables
         self.pos = pygame.math.Vector2(self.hitbox.center)
+        self.prev_pos = pygame.math.Vector2(self.pos) # Where the current simulation step started
         self.direction = pygame.math.Vector2()
         self.current_speed:Num = 0
         self.base_speed = base_speed
@@ -67,13 +74,16 @@ class MovingEntity(Entity):
         self.state: EntityState = EntityState.IDLE
         self.facing: Direction = Direction.DOWN
 
-    @staticmethod
-    def _hitbox_collide(entity:Any, obj:Any) -> bool:
-        """Custom Pygame collision callback to check hitboxes instead of visual rects."""
-        target_rect = getattr(obj, 'hitbox', obj.rect)
-        return entity.hitbox.colliderect(target_rect)
+    def store_previous_position(self) -> None:
+        """Called at the start of every simulation step (and after teleporting), for render interpolation."""
+        self.prev_pos.update(self.pos)
+
+    def render_pos(self, alpha: float) -> tuple[int, int]:
+        """The rect's top left, alpha of the way from the previous step's position to the current one."""
+        return (round(self.rect.x - (self.pos.x - self.prev_pos.x) * (1 - alpha)),
+                round(self.rect.y - (self.pos.y - self.prev_pos.y) * (1 - alpha)))
 
-    def move(self, dt:Num, collidable_objects:Interactables) -> None:
+    def move(self, dt:Num, collidable_objects:CollisionWorld) -> None:
         """Applies vector movement and handles axis-separated collisions."""
         if self.direction.magnitude_squared() == 0: 
             self.finalize_movement()
@@ -93,45 +103,32 @@ class MovingEntity(Entity):
         
         self.finalize_movement()
 
-    def check_horizontal(self, collidable_objects:Interactables) -> None:
-        """Resolves collisions on the X axis."""
-        potential_hits = pygame.sprite.spritecollide(self, collidable_objects, False, collided=self._hitbox_collide) #type:ignore
-        
-        for obj in potential_hits:
-            is_solid = getattr(obj, 'obstructed', False) or getattr(obj, '_base_obstructed', False)
-        
-            if is_solid:
-                target_rect = obj.hitbox if hasattr(obj, 'hitbox') else obj.rect
+    def check_horizontal(self, collidable_objects:CollisionWorld) -> None:
+        """Resolves collisions on the X axis (only the solids under the hitbox are looked at)."""
+        for obj in collidable_objects.solids_in_rect(self.hitbox):
+            target_rect = obj.hitbox if hasattr(obj, 'hitbox') else obj.rect
+            
+            if self.direction.x > 0: # Moving Right
+                self.hitbox.right = target_rect.left
+            elif self.direction.x < 0: # Moving Left
+                self.hitbox.left = target_rect.right
                 
-                if self.direction.x > 0: # Moving Right
-                    self.hitbox.right = target_rect.left
-                elif self.direction.x < 0: # Moving Left
-                    self.hitbox.left = target_rect.right
-                    
-                self.pos.x = self.hitbox.centerx
-
-    def check_vertical(self, collidable_objects:Interactables) -> None:
-        """Resolves collisions on the Y axis."""
-        potential_hits = pygame.sprite.spritecollide(self, collidable_objects, False, collided=self._hitbox_collide) #type:ignore
-        
-        for obj in potential_hits:
-            is_solid = getattr(obj, 'obstructed', False) or getattr(obj, '_base_obstructed', False)
-        
-            if is_solid:
-                target_rect = obj.hitbox if hasattr(obj, 'hitbox') else obj.rect
+            self.pos.x = self.hitbox.centerx
+
+    def check_vertical(self, collidable_objects:CollisionWorld) -> None:
+        """Resolves collisions on the Y axis (only the solids under the hitbox are looked at)."""
+        for obj in collidable_objects.solids_in_rect(self.hitbox):
+            target_rect = obj.hitbox if hasattr(obj, 'hitbox') else obj.rect
+            
+            if self.direction.y > 0: # Moving Down
+                self.hitbox.bottom = target_rect.top
+            elif self.direction.y < 0: # Moving Up
+                self.hitbox.top = target_rect.bottom
                 
-                if self.direction.y > 0: # Moving Down
-                    self.hitbox.bottom = target_rect.top
-                elif self.direction.y < 0: # Moving Up
-                    self.hitbox.top = target_rect.bottom
-                    
-                self.pos.y = self.hitbox.centery
+            self.pos.y = self.hitbox.centery
 
     def finalize_movement(self) -> None:
-        """Clamps the hitbox to the screen and syncs all positioning variables."""
-        screen_bounds = pygame.Rect(0, 0, WIDTH, HEIGHT)
-        self.hitbox.clamp_ip(screen_bounds)
-        
+        """Syncs all positioning variables to the hitbox (the world streams in, so there is no edge to clamp to)."""
         self.pos.x = self.hitbox.centerx
         self.pos.y = self.hitbox.centery
         
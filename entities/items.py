@@ -10,7 +10,7 @@ from entities.entity import Entity
 if TYPE_CHECKING:
     from entities.player import Player
     from groups.camera import CameraGroup
-    from custom_types import Interactables
+    from world.collision import CollisionWorld
 
 class Item:
     """ Base class for an inventory item. 
@@ -60,7 +60,7 @@ class Item:
         self.count -= amount
         return amount
 
-    def use(self, player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+    def use(self, player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
         """Default behavior for unusable items. Returns True if action succeeded."""
         return False
         
@@ -70,7 +70,7 @@ class Item:
 
 
 # --- INDEPENDENT TOOL STRATEGY FUNCTIONS ---
-def _use_hoe_strategy(player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+def _use_hoe_strategy(player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
     """Tills the soil if it is a valid ground tile."""
     # Ensure we are targeting a Tile, not an Entity
     if not isinstance(target, Tile):
@@ -91,7 +91,7 @@ def _use_hoe_strategy(player: Player, target: Tile | Entity | None, interactable
     target.level.till_map_node(target.grid_x, target.grid_y)
     return True
 
-def _use_water_strategy(player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+def _use_water_strategy(player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
     if not isinstance(target, Tile):
         Log.error("You can only water soil tiles!")
         return False
@@ -115,15 +115,15 @@ def _use_water_strategy(player: Player, target: Tile | Entity | None, interactab
     Log.success(f"Watered tile at {target.grid_x}, {target.grid_y}! (Water left: {active_item.water_level}/{active_item.max_water})")
     return True
 
-def _use_axe_strategy(player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+def _use_axe_strategy(player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
     Log.info("Chop chop")
     return True
 
-def _use_pickaxe_strategy(player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+def _use_pickaxe_strategy(player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
     Log.info("Breaking stone...")
     return True
 
-def _use_generic_strategy(player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+def _use_generic_strategy(player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
     """Fallback for tools with no specific logic yet."""
     return False
 
@@ -147,16 +147,16 @@ class ToolItem(Item):
             self.max_water = 10
             self.water_level = 10
 
-    def use(self, player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+    def use(self, player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
         if not target: 
             return False
 
         t_type = self.tool_type
         if not t_type:
-            return _use_generic_strategy(player, target, interactables, group)
+            return _use_generic_strategy(player, target, world, group)
 
         strategy_func = self.STRATEGIES.get(t_type, _use_generic_strategy)
-        return strategy_func(player, target, interactables, group)
+        return strategy_func(player, target, world, group)
     
     def has_water(self) -> bool:
         """Safely checks if the watering can has available water."""
@@ -169,7 +169,7 @@ class ToolItem(Item):
 
 class SeedItem(Item):
     """Handles planting logic and consumes 1 stack count upon success."""
-    def use(self, player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+    def use(self, player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
         if self.count <= 0 or not isinstance(target, Tile): 
             return False
         
@@ -180,12 +180,12 @@ class SeedItem(Item):
         plant_id = self.item_id.replace("_seeds", "")
         Log.info(f"Planting {plant_id}...")
         
-        target.level.spawn_plant(plant_id, target.grid_x, target.grid_y, group)
+        target.level.spawn_plant(plant_id, target.grid_x, target.grid_y, group, world)
         self.count -= 1
         return True
 
 class FoodItem(Item):
-   def use(self, player: Player, target: Tile | Entity | None, interactables: Interactables, group: CameraGroup) -> bool:
+   def use(self, player: Player, target: Tile | Entity | None, world: CollisionWorld, group: CameraGroup) -> bool:
         if self.count <= 0: 
             return False
         Log.info(f"Yum! Ate {self.name} for {self.data.energy_gain} energy.")
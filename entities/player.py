@@ -19,7 +19,8 @@ from groups.camera import CameraGroup
 
 # Type-Only Imports (Prevents Circular Imports)
 if TYPE_CHECKING:
-    from custom_types import Direction, Item, Group, Pos, Interactables, Num
+    from custom_types import Direction, Item, Group, Pos, Num
+    from world.collision import CollisionWorld
 
 class Player(MovingEntity):
     #Inventory Variables
@@ -66,12 +67,12 @@ class Player(MovingEntity):
         for item_id, count in PLAYER_START_INVENTORY:
             self.inventory.data.add_item(create_item(item_id, count))
        
-    def handle_event(self, event: pygame.event.Event, interactables:Interactables) -> None:
+    def handle_event(self, event: pygame.event.Event, world:CollisionWorld) -> None:
         """Handles discrete inputs (clicks). Call this from Game Loop."""
         if event.type == pygame.KEYDOWN:
             # Interact
             if event.key == controls.interact:
-                self.interact(interactables)
+                self.interact(world)
             elif event.key == controls.refill:  # Listen for 'R'
                 self.refill_active_watering_can()
             
@@ -84,6 +85,7 @@ class Player(MovingEntity):
         active_item = self.inventory.get_active_item()
         if active_item and getattr(active_item, 'tool_type', None) == ToolType.WATER:
             active_item.water_level = active_item.max_water
+            self.inventory.data.mark_unsaved()
             Log.success(f"Refilled {active_item.name}! Water level: {active_item.water_level}/{active_item.max_water}")
         else:
             Log.info("Equip a watering can to refill it.")
@@ -121,7 +123,7 @@ class Player(MovingEntity):
         else:
             self.current_speed = self.base_speed
 
-    def update(self, dt:Num, interactables:Interactables, mouse_pos:Pos|None=None):
+    def update(self, dt:Num, world:CollisionWorld, mouse_pos:Pos|None=None):
         """Main update loop. 
             Requires dt (delta time) for smooth vector movement."""
         self.input()
@@ -132,13 +134,13 @@ class Player(MovingEntity):
             self.rect.size = self.image.get_size()
             self.sync_rect_to_hitbox()
         
-        self.move(dt, interactables)
+        self.move(dt, world)
         self.inventory.update(mouse_pos)
 
-    def interact(self, interactables:Interactables) -> None:
+    def interact(self, world:CollisionWorld) -> None:
         """Interacts with the tile or entity directly under the player's target offset."""
         # Ask the Component what we are looking at!
-        hit_objects = self.targeter.get_target_objects(interactables)
+        hit_objects = self.targeter.get_target_objects(world)
         
         if not hit_objects:
             return # Looking at nothing
@@ -148,10 +150,11 @@ class Player(MovingEntity):
         active_item = self.inventory.get_active_item()
        
         if active_item: 
-            # Pass the raw target and full interactables list directly to the item
-            used = active_item.use(self, target_obj, interactables, self.camera_group)
+            # Pass the raw target and the collision world directly to the item
+            used = active_item.use(self, target_obj, world, self.camera_group)
         
             if used: # clean up if consumed
+                self.inventory.data.mark_unsaved() # Counts and water levels change in place
                 self.inventory.consume_active_item()
             return
 
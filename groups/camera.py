@@ -13,6 +13,10 @@ class CameraGroup(pygame.sprite.Group):
         super().__init__()
         self.display_surface = pygame.display.get_surface()
         self.offset = pygame.math.Vector2()
+        
+        # Culling stats from the last draw (shown in the debug overlay)
+        self.drawn_count: int = 0
+        self.culled_count: int = 0
 
     @property
     def entities(self) -> list['Entity']:
@@ -20,22 +24,38 @@ class CameraGroup(pygame.sprite.Group):
         # By casting to Entity, Pylance knows everything in this list has a .hitbox
         return cast(list['Entity'], self.sprites())
 
-    def custom_draw(self, player: Player)-> None:
-        # Calculate Camera Offset (to keep player centered)
-        self.offset.x = player.rect.centerx - WIDTH // 2
-        self.offset.y = player.rect.centery - HEIGHT // 2
+    def follow(self, player: Player, alpha: float = 1.0) -> None:
+        """Calculate Camera Offset (to keep player centered, where they are drawn)"""
+        left, top = player.render_pos(alpha)
+        self.offset.x = left + player.rect.width // 2 - WIDTH // 2
+        self.offset.y = top + player.rect.height // 2 - HEIGHT // 2
+
+    def get_view_rect(self) -> pygame.Rect:
+        """The area of the world currently on screen, snapped to integers to prevent tearing."""
+        return pygame.Rect(int(self.offset.x), int(self.offset.y), WIDTH, HEIGHT)
+
+    def custom_draw(self, player: Player, alpha: float = 1.0)-> None:
+        """Draws what is on screen, with moving entities alpha of the way between simulation steps."""
+        self.follow(player, alpha)
+        view_rect = self.get_view_rect()
+        
+        # Cull anything off screen before sorting, so we only sort what we draw
+        visible = [sprite for sprite in self.entities if view_rect.colliderect(sprite.rect)]
+        self.drawn_count = len(visible)
+        self.culled_count = len(self) - self.drawn_count
 
         # Sort by the bottom of the hitbox (Y-Sorting)
         # This ensures entities "lower" on screen are drawn last (on top)
-        for sprite in sorted(self.entities, key=lambda sprite: sprite.hitbox.bottom):
+        for sprite in sorted(visible, key=lambda sprite: sprite.hitbox.bottom):
             # Calculate offset position
-            offset_x = int(sprite.rect.left - self.offset.x)
-            offset_y = int(sprite.rect.top - self.offset.y)
+            left, top = sprite.render_pos(alpha)
+            offset_x = left - view_rect.left
+            offset_y = top - view_rect.top
             
             if sprite.image:
                 self.display_surface.blit(sprite.image, (offset_x, offset_y))
             
             if DEBUG:
-                pygame.draw.rect(self.display_surface, (0,255,0), sprite.rect.move(-self.offset.x, -self.offset.y), 1)
-                pygame.draw.rect(self.display_surface, (255,0,0), sprite.hitbox.move(-self.offset.x, -self.offset.y), 1)
-                
+                shift_x, shift_y = offset_x - sprite.rect.left, offset_y - sprite.rect.top
+                pygame.draw.rect(self.display_surface, (0,255,0), sprite.rect.move(shift_x, shift_y), 1)
+                pygame.draw.rect(self.display_surface, (255,0,0), sprite.hitbox.move(shift_x, shift_y), 1)
@@ -1,8 +1,11 @@
 from __future__ import annotations
+import heapq
+import itertools
 import pygame
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 from entities.plant import Plant
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, ValuesView
+from settings import BLOCK_SIZE
 
 if TYPE_CHECKING:
     from custom_types import Any, Num
@@ -12,11 +15,27 @@ if TYPE_CHECKING:
 class PlantGroup(pygame.sprite.Group):
     def __init__(self):
         super().__init__()
+        self.by_grid: dict[tuple[int, int], Plant] = {} # (grid_x, grid_y) -> plant, kept in step with the group
+        self.unsaved: set[Plant] = set() # Plants changed since the last autosave
+
+        # Growth: every plant ages with this clock, and only plants due a new stage are touched
+        self.growth_time: float = 0.0
+        self.stage_changes: list[tuple[float, int, int, Plant]] = [] # (due growth_time, tie-break, schedule_id, plant)
+        self._order = itertools.count()
 
     @property
-    def plants(self) -> list[Plant]:
-        """Returns a strictly-typed list of Plant objects."""
-        return cast(list[Plant], self.sprites())
+    def plants(self) -> ValuesView[Plant]:
+        """A live, strictly-typed view of the plants (no copy, so don't add or remove plants while looping over it)."""
+        return self.by_grid.values()
+
+    def __iter__(self) -> Iterator[Plant]:
+        return iter(list(self.by_grid.values())) # A copy, like pygame's, so plants can be killed while looping
+
+    def __len__(self) -> int:
+        return len(self.by_grid) # pygame's version copies every sprite into a list first
+
+    def __bool__(self) -> bool:
+        return bool(self.by_grid)
 
     def add(self, *sprites: Any) -> None:
         """
@@ -33,13 +52,74 @@ class PlantGroup(pygame.sprite.Group):
                 raise TypeError(f"PlantGroup only accepts 'Plant' objects, not {type(item).__name__}")
             
     def grow_all(self, amount: Num) -> None:
-        """Ticks the growth logic for every plant in this group."""
-        for plant in self.plants:
-            plant.grow(amount)
+        """Ages every plant in this group by any amount (a tick or a week), in one step.
+            Only the plants that reach a new stage are touched, each at most once, so this costs
+            the number of stage changes, not the number of plants or the length of the skip."""
+        self.growth_time += amount
+        stage_changes = self.stage_changes
+        while stage_changes and stage_changes[0][0] <= self.growth_time:
+            _, _, schedule_id, plant = heapq.heappop(stage_changes)
+            if plant.schedule_id != schedule_id or plant.grower is not self:
+                continue # Rescheduled or removed since this entry was pushed
+            plant.update_visuals()
+            plant.mark_unsaved()
+            plant.reschedule()
+
+    def schedule(self, plant: Plant) -> None:
+        """Queues the plant's next stage change (see PlantData.next_stage_age). Called by Plant.reschedule."""
+        age = plant.age
+        next_age = plant.data.next_stage_age(age, plant.is_harvested)
+        if next_age is not None:
+            due = self.growth_time + (next_age - age)
+            heapq.heappush(self.stage_changes, (due, next(self._order), plant.schedule_id, plant))
+
+    def add_internal(self, sprite: Any, layer: Any = None) -> None:
+        """Every way into the group ends here (including Plant(..., group)), so new plants get indexed and saved."""
+        replaced = self.by_grid.get((sprite.grid_x, sprite.grid_y))
+        if replaced is not None:
+            replaced.kill() # One plant per tile: a new plant replaces the old one, which would otherwise keep growing unseen
+        super().add_internal(sprite)
+        self.by_grid[(sprite.grid_x, sprite.grid_y)] = sprite
+        self.unsaved.add(sprite)
+        sprite.set_grower(self)
+
+    def remove_internal(self, sprite: Any) -> None:
+        """Every way out (remove, kill, empty) ends here."""
+        super().remove_internal(sprite)
+        if self.by_grid.get((sprite.grid_x, sprite.grid_y)) is sprite:
+            del self.by_grid[(sprite.grid_x, sprite.grid_y)]
+        if sprite.grower is self:
+            sprite.set_grower(None)
+        self._drop_stale_changes()
+
+    def _drop_stale_changes(self) -> None:
+        """Rebuilds the heap without the entries of removed or rescheduled plants, once those outnumber the live ones
+            (otherwise a removed plant stays referenced until its stage change falls due)."""
+        if len(self.stage_changes) > 2 * len(self.by_grid) + 64:
+            self.stage_changes[:] = [change for change in self.stage_changes
+                                  if change[3].schedule_id == change[2] and change[3].grower is self]
+            heapq.heapify(self.stage_changes)
+
+    def mark_unsaved(self, plant: Plant) -> None:
+        self.unsaved.add(plant)
+
+    def take_unsaved(self) -> list[Plant]:
+        """The plants changed since the last call (for autosaving), then clears the list."""
+        plants = [plant for plant in self.unsaved if plant.alive()]
+        self.unsaved.clear()
+        return plants
 
     def get_plant_at_grid(self, grid_x: int, grid_y: int) -> Plant | None:
         """Helper to find a specific plant instance by its coordinates."""
-        for plant in self.plants:
-            if plant.grid_x == grid_x and plant.grid_y == grid_y:
-                return plant
-        return None
+        return self.by_grid.get((grid_x, grid_y))
+
+    def plants_in_rect(self, rect: pygame.Rect) -> list[Plant]:
+        """Every plant planted on a tile touching a world-space rect.
+            Looks each tile up in the index, or scans the plants instead if there are fewer of them."""
+        cols = range(rect.left // BLOCK_SIZE, (rect.right - 1) // BLOCK_SIZE + 1)
+        rows = range(rect.top // BLOCK_SIZE, (rect.bottom - 1) // BLOCK_SIZE + 1)
+        if len(cols) * len(rows) > len(self.by_grid):
+            return [plant for (grid_x, grid_y), plant in self.by_grid.items() if grid_x in cols and grid_y in rows]
+
+        by_grid = self.by_grid
+        return [by_grid[(grid_x, grid_y)] for grid_y in rows for grid_x in cols if (grid_x, grid_y) in by_grid]
@@ -5,10 +5,13 @@ from typing import TYPE_CHECKING
 
 from core.debug_logger import Log
 from core.states.menus import SettingsState
-from settings import WIDTH, HEIGHT, FPS
+from settings import WIDTH, HEIGHT, FPS, SIM_HZ, MAX_SIM_STEPS, SAVE_PATH, USE_SAVE_DATABASE, SAVE_DATABASE_PATH
 from core.assets import ASSETS
+from core.timer_wheel import TIMERS
 from core.types import StateStack, StateID
 from core.states import (GameState, PlayingState, ShopState, STATE_REGISTRY)
+from world.save_file import read_save
+from world.save_database import read_save_database
 
 if TYPE_CHECKING:
     from core.types import ShopData
@@ -22,7 +25,10 @@ class Game:
         self.clock: pygame.time.Clock = pygame.time.Clock()
         self.running: bool = True
         self.tick: int = 0
-        self.dt = 0.0 # Delta time
+        self.dt = 0.0 # Real time since the last frame
+        self.sim_dt = 1.0 / SIM_HZ # Every update is exactly one step this long
+        self.accumulator = 0.0 # Real time not yet simulated
+        self.alpha = 1.0 # How far the frame is from the last step towards the next (for render interpolation)
 
         # Load Assets
         ASSETS.load_all()
@@ -57,8 +63,19 @@ class Game:
                     self.quit()
                 current_state.handle_event(event)
 
-            # Update & Draw 
-            self.stack.update(self.dt)
+            # Update in fixed steps, whatever the frame rate (spiral-of-death clamp: at most MAX_SIM_STEPS)
+            TIMERS.update(self.dt) # UI timers and autosaves
+            self.accumulator += self.dt
+            steps = 0
+            while self.accumulator >= self.sim_dt and steps < MAX_SIM_STEPS:
+                self.stack.update(self.sim_dt)
+                self.accumulator -= self.sim_dt
+                steps += 1
+            if steps == MAX_SIM_STEPS:
+                self.accumulator = min(self.accumulator, self.sim_dt)
+
+            # Draw entities between the last two steps
+            self.alpha = self.accumulator / self.sim_dt
             self.stack.draw(self.screen)
             
             pygame.display.update()
@@ -81,10 +98,15 @@ class Game:
             self.stack.change(instance)
 
     def start_new_game(self, character_type):
-        self.change(PlayingState(self, character_type))
+        # The world is generated in the background while the loading screen runs
+        self.open_state(StateID.LOADING, character_type)
 
     def load_save_game(self):
-        self.change(PlayingState(self))
+        """Continues from the save file, or starts a new game if there isn't one."""
+        save = read_save_database(SAVE_DATABASE_PATH) if USE_SAVE_DATABASE else read_save(SAVE_PATH)
+        if save is None:
+            Log.info("No save game found, starting a new game.")
+        self.open_state(StateID.LOADING, save=save)
 
     def open_shop(self, player_ref, shop_data: ShopData):
         self.push(ShopState(self, player_ref, shop_data))
@@ -96,6 +118,10 @@ class Game:
         """Safely shuts down the game, cleans assets, and exits."""
         Log.info("Initiating shutdown sequence...")
         self.running = False
+        for state in self.stack:
+            if isinstance(state, PlayingState):
+                state.save_game()
+                state.autosaver.close() # Wait for the save to reach the disk
         ASSETS.clean_up()
         pygame.quit()
         sys.exit()
@@ -13,14 +13,39 @@ HEIGHT = BLOCK_SIZE * TILES_Y
 
 SPRITESHEET_SIZE = BLOCK_SIZE // 4
 QUAD_SIZE = BLOCK_SIZE // 2
+CHUNK_SIZE = 8 # Tiles per side of each world chunk (also the pre-baked terrain chunks)
+CHUNK_LOAD_RADIUS = 2 # Chunks around the player that are kept loaded
+CHUNK_UNLOAD_RADIUS = 4 # Chunks further away than this are evicted
+CHUNK_BAKES_PER_FRAME = 4 # Chunk surfaces the loading screen bakes each frame
 
-FPS = 60
+FPS = 60 # Render rate (can be lowered on weak machines without changing gameplay)
+SIM_HZ = 60 # Fixed simulation steps per second
+MAX_SIM_STEPS = 5 # Most steps run in one frame; time past that is dropped, so a slow frame can't snowball
 ANIMATION_SPEED = 5 # Lower is faster (ticks per frame)
 INTERACTION_DISTANCE = 20
 
 # Gameplay Config
 DETAIL_CHANCE = 0.2
 
+# Saving
+SAVE_PATH = "saves/world.sav"
+AUTOSAVE_INTERVAL = 10.0 # Seconds between autosaves (only what changed is written)
+USE_SAVE_DATABASE = False # Save to an SQLite database (SAVE_DATABASE_PATH) instead of the binary save file
+SAVE_DATABASE_PATH = "saves/world.db"
+
+# Game Clock
+DAY_LENGTH = 1200.0 # Real seconds per in-game day at x1
+MINUTES_PER_DAY = 24 * 60
+DAY_START = 6 * 60 # New games start, and watered soil dries, at 06:00
+GROWTH_INTERVAL = 10 # Game minutes between crop growth steps
+GAME_SPEEDS = (1, 10, 100, 1000) # Fast-forward multipliers (, and . step through them)
+OFFLINE_SPEED = 1 # The clock keeps running at this speed while the game is closed (0 = time stops)
+
+# Performance
+USE_NUMPY = True # Vectorised world generation (only used if NumPy is installed)
+USE_CROP_FIELD = False # Keep crops in NumPy arrays, with sprites only for the ones on screen (needs NumPy)
+CROP_FIELD_MARGIN = 2 # Tiles past the screen edge whose crops keep their sprites (trees are drawn taller than a tile)
+
 # Inventory UI
 INV_SIZE = 8
 INV_PADDING = 5
@@ -19,6 +19,11 @@ class Inventory:
     def __init__(self, max_size:int=16) -> None:
         self.max_size:int = max_size
         self.items:list[Item|None] = [None] * max_size # Just stores Item objects
+        self.unsaved:bool = True # Changed since the last autosave
+    
+    def mark_unsaved(self) -> None:
+        """Call after changing an item in place (count, water level) or moving it between slots."""
+        self.unsaved = True
 
     def get_amount(self, item_name: str) -> int:
         """Helper: Quickly get the total count of a specific item across all stacks."""
@@ -26,6 +31,7 @@ class Inventory:
 
     def add_item(self, new_item:Item) -> bool:
         """ Handles stacking and splitting large stacks into multiple empty slots. """
+        self.unsaved = True
         remaining = new_item.count
         
         # Try to add to existing stacks first
@@ -58,6 +64,7 @@ class Inventory:
         #make sure we have enough BEFORE removing
         if self.get_amount(item_name) < amount:
             return False
+        self.unsaved = True
         # Iterate backwards
         for i in range(self.max_size - 1, -1, -1):
             item = self.items[i]
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from ui.timer import Timer
+from core.timer_wheel import TIMERS
 from typing import TYPE_CHECKING
 import pygame
 from core.assets import ASSETS
@@ -47,32 +47,23 @@ class FlashWrapper(BaseWrapper):
         super().__init__(target)
         self.interval = interval
         
-        self.flash_timer = Timer(interval)
         self.is_flashing = False
-        self.is_blank = False # True means the object is currently "invisible" in the blink
+        self.flash_start = 0.0 # TIMERS.now when the flashing began
+
+    @property
+    def is_blank(self) -> bool:
+        """True means the object is currently "invisible" in the blink.
+            Worked out from the shared TIMERS clock, so nothing is scheduled that could outlive the wrapper."""
+        return self.is_flashing and int((TIMERS.now - self.flash_start) / self.interval) % 2 == 1
 
     def start_flash(self) -> None:
         """Begins the flashing effect."""
         self.is_flashing = True
-        self.is_blank = False
-        self.flash_timer.start()
+        self.flash_start = TIMERS.now
 
     def stop_flash(self) -> None:
         """Stops the flashing and ensures the object is visible."""
         self.is_flashing = False
-        self.is_blank = False
-
-    def update(self, *args, **kwargs) -> None:
-        """Updates the underlying target and handles blink timing."""
-        # Always update the target object first (passing along any arguments like mouse_pos)
-        self.target.update(*args, **kwargs)
-
-        # Handle the flash timer logic
-        if self.is_flashing:
-            # If the timer hits 0 (update returns False)
-            if not self.flash_timer.update():
-                self.is_blank = not self.is_blank  # Toggle visibility
-                self.flash_timer.start()        # Reset the timer for the next blink
 
     def draw(self, screen: Any) -> None:
         """Draws the underlying target only if it isn't in a blank flash frame."""
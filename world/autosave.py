@@ -0,0 +1,96 @@
+from __future__ import annotations
+import queue
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING
+
+# Runtime Imports
+from settings import SAVE_PATH, AUTOSAVE_INTERVAL, USE_SAVE_DATABASE, SAVE_DATABASE_PATH
+from core.debug_logger import Log
+from core.timer_wheel import TIMERS
+from world.save_file import append_journal, write_save
+from world.save_database import SaveDatabase
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    from world.save_file import SaveDelta, SaveGame
+    from core.timer_wheel import TimerWheel, TimerEntry
+    from core.states.playing import PlayingState
+
+class AutoSaver:
+    """ Writes saves on a worker thread, so the game loop never waits on the disk.
+    Every AUTOSAVE_INTERVAL seconds (a timer on the TIMERS wheel) only what changed (see PlayingState.autosave_deltas)
+    is appended to the save's journal; full saves (checkpoints) replace the save file and start a new journal.
+    With USE_SAVE_DATABASE, both are written to the SQLite save database instead (as upserts). """
+    def __init__(self, seed: int, path: str | None = None, interval: float = AUTOSAVE_INTERVAL,
+                 generation: int | None = None, use_database: bool = USE_SAVE_DATABASE, timers: TimerWheel = TIMERS) -> None:
+        self.seed = seed
+        self.use_database = use_database
+        self.path = path or (SAVE_DATABASE_PATH if use_database else SAVE_PATH)
+        self.interval = interval
+        self.generation = generation # None until there is a save file to journal against
+        self.timers = timers
+        self.timer: TimerEntry | None = None
+
+        # Stats (for the debug overlay)
+        self.flush_ms = 0.0    # Main-thread cost of the last flush
+        self.journal_bytes = 0 # Written since the last checkpoint
+
+        self._jobs: queue.Queue[tuple[str, int, SaveDelta | SaveGame] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="AutoSave", daemon=True)
+        self._thread.start()
+
+    def start(self, state: PlayingState) -> None:
+        """Starts autosaving the session every interval."""
+        self.timer = self.timers.every(self.interval, lambda elapsed: self.flush(state))
+
+    def flush(self, state: PlayingState) -> None:
+        """Collects the deltas on the main thread (just byte copies) and hands them to the worker."""
+        if self.generation is None:
+            self.checkpoint(state.snapshot()) # Nothing to journal against yet
+            state.autosave_deltas()
+            return
+
+        start = time.perf_counter()
+        delta = state.autosave_deltas()
+        if delta:
+            self._jobs.put(("journal", self.generation, delta))
+        self.flush_ms = (time.perf_counter() - start) * 1000
+
+    def checkpoint(self, save: SaveGame) -> None:
+        """Queues a full save. Journals queued after it apply to the new save generation."""
+        self.generation = (self.generation or 0) + 1
+        save.generation = self.generation
+        self.journal_bytes = 0
+        if self.timer is not None: # The next autosave is a full interval away again
+            self.timer.due = self.timers.now + self.interval
+            self.timers.schedule(self.timer)
+        self._jobs.put(("checkpoint", self.generation, save))
+
+    def close(self) -> None:
+        """Stops autosaving, and waits for every queued save to reach the disk."""
+        if self.timer is not None:
+            self.timers.cancel(self.timer)
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        database: SaveDatabase | None = None # SQLite connections belong to the thread that opened them
+        while (job := self._jobs.get()) is not None:
+            kind, generation, data = job
+            try:
+                if self.use_database:
+                    database = database or SaveDatabase(self.path)
+                    if kind == "checkpoint":
+                        database.save(data)
+                    else:
+                        database.apply(data)
+                elif kind == "checkpoint":
+                    write_save(self.path, data)
+                else:
+                    self.journal_bytes += append_journal(self.path, generation, self.seed, data)
+            except (OSError, sqlite3.Error) as error:
+                Log.error(f"Could not save the game: {error}")
+        if database:
+            database.close()
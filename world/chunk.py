@@ -0,0 +1,47 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+# Runtime Imports
+from world.tile import Tile
+from world.tile_store import TileStore
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    from world.level import Level
+
+ChunkKey = tuple[int, int]
+
+@dataclass
+class ChunkRecord:
+    """The mutated state of a chunk that has been evicted from memory.
+        Anything left as None is rebuilt from the world seed when the chunk loads again."""
+    nodes: bytes | None = None # The chunk's own (2 * size) x (2 * size) nodes, row by row
+    flags: bytes | None = None # TileStore flags (tilled, watered, etc), row by row
+
+class WorldChunk:
+    """ A CHUNK_SIZE x CHUNK_SIZE block of materialised tiles.
+    Chunk (cx, cy) holds the tiles from grid (cx * size, cy * size) onwards, in its own TileStore. """
+    __slots__ = ("key", "size", "origin_x", "origin_y", "tiles")
+
+    def __init__(self, key: ChunkKey, size: int) -> None:
+        self.key = key
+        self.size = size
+        self.origin_x = key[0] * size
+        self.origin_y = key[1] * size
+        self.tiles = TileStore(size, size)
+
+    def __repr__(self) -> str:
+        return f"WorldChunk{self.key}"
+
+    @property
+    def grid_range(self) -> tuple[range, range]:
+        """The grid columns and rows covered by this chunk."""
+        return range(self.origin_x, self.origin_x + self.size), range(self.origin_y, self.origin_y + self.size)
+
+    def index(self, grid_x: int, grid_y: int) -> int:
+        """TileStore index for a (world) grid coordinate inside this chunk."""
+        return (grid_y - self.origin_y) * self.size + (grid_x - self.origin_x)
+
+    def tile(self, level: Level, grid_x: int, grid_y: int) -> Tile:
+        return Tile.create(level, self.tiles, grid_x, grid_y, self.index(grid_x, grid_y))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+import pygame
+from typing import TYPE_CHECKING, Any
+
+# Runtime Imports
+from settings import BLOCK_SIZE
+from world.spatial_hash import SpatialHash
+from world.tile_store import TileStore
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    from entities.entity import Entity
+    from world.level import Level
+    from world.tile import Tile
+
+class CollisionWorld(pygame.sprite.Group):
+    """ Everything entities can bump into or use, kept up to date instead of being rebuilt every frame.
+    Entities join it like any sprite group and are bucketed in a SpatialHash (re-bucketed by reindex when they
+    move or resize), while tiles are read straight from the level's chunks. Owned by PlayingState. """
+    def __init__(self, level: Level) -> None:
+        super().__init__()
+        self.level = level
+        self.bodies = SpatialHash(bounds=self.reach) # Covers both the drawn rect (targeting) and hitbox (collisions)
+
+    @staticmethod
+    def reach(entity: Entity) -> pygame.Rect:
+        return entity.rect.union(entity.hitbox)
+
+    # --- MEMBERSHIP ---
+    def add_internal(self, sprite: Any, layer: Any = None) -> None:
+        super().add_internal(sprite)
+        self.bodies.insert(sprite)
+
+    def remove_internal(self, sprite: Any) -> None:
+        super().remove_internal(sprite)
+        self.bodies.remove(sprite)
+
+    def reindex(self, entity: Entity) -> None:
+        """Called by entities whose rect or hitbox has changed."""
+        if entity in self.bodies:
+            self.bodies.update(entity)
+
+    # --- QUERIES ---
+    def solids_in_rect(self, rect: pygame.Rect) -> list[Tile | Entity]:
+        """Everything solid overlapping a world-space rect (for MovingEntity collisions):
+            obstructed tiles, read from the grid, then solid entities by hitbox."""
+        level = self.level
+        solids: list[Tile | Entity] = []
+        for grid_y in range(rect.top // BLOCK_SIZE, (rect.bottom - 1) // BLOCK_SIZE + 1):
+            for grid_x in range(rect.left // BLOCK_SIZE, (rect.right - 1) // BLOCK_SIZE + 1):
+                chunk = level.chunks.get(level.chunk_key(grid_x, grid_y))
+                if chunk and chunk.tiles.flags[chunk.index(grid_x, grid_y)] & TileStore.OBSTRUCTED:
+                    solids.append(chunk.tile(level, grid_x, grid_y))
+        solids.extend(body for body in self.bodies.query(rect)
+                      if getattr(body, "obstructed", False) and rect.colliderect(body.hitbox))
+        return solids
+
+    def objects_at(self, point: tuple[int, int]) -> list[Tile | Entity]:
+        """What is under a world-space point (for targeting): the tile there and whatever occupies it,
+            then any other entity drawn over the point (one spatial hash cell). Costs the same on any map size."""
+        objects: list[Tile | Entity] = []
+        tile = self.level.get_tile(point[0] // BLOCK_SIZE, point[1] // BLOCK_SIZE)
+        if tile:
+            objects.append(tile)
+            occupant = tile.occupant
+            if occupant is not None and self.has(occupant): # Skip occupants that have since been removed
+                objects.append(occupant)
+
+        # Off-grid entities, and tall ones (trees) drawn over neighbouring tiles
+        probe = pygame.Rect(point, (1, 1))
+        objects.extend(body for body in self.bodies.query(probe) if body not in objects and body.rect.collidepoint(point))
+        return objects
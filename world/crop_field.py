@@ -0,0 +1,196 @@
+from __future__ import annotations
+import pygame
+from typing import TYPE_CHECKING
+
+# Runtime Imports
+from settings import BLOCK_SIZE, CROP_FIELD_MARGIN
+from core.assets import ASSETS
+from world.save_file import PlantRecord
+from world.level import HAS_NUMPY
+
+# Optional Imports
+if HAS_NUMPY: # Without NumPy every crop stays a Plant sprite
+    import numpy as np
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    from custom_types import Group, Pos
+    from entities.plant import Plant
+    from world.level import Level
+
+class CropField:
+    """ Every crop on the farm as a row of NumPy arrays (type, position, age, harvested), keyed by tile.
+    Ages are worked out from the plant group's growth clock just like Plant.age, so growing the whole field
+    costs nothing, and stages and harvest-readiness are computed for every row at once.
+    Plant sprites are only made for the crops around the screen (show), and fold their changes back
+    into the field when they scroll away or are saved. Owned by PlayingState when USE_CROP_FIELD is on. """
+    def __init__(self, level: Level, *groups: Group, capacity: int = 1024) -> None:
+        self.level = level
+        self.plants = level.plant_group # Holds the sprites, and its growth clock ages the field
+        self.groups = groups            # Extra groups sprites are made in (the camera and collision world)
+        self.area: tuple[int, int, int, int] | None = None # Grid-space (left, top, right, bottom) with sprites
+
+        # One row per crop
+        self.rows: dict[Pos, int] = {} # (grid_x, grid_y) -> row
+        self.count = 0
+        self.grid_x = np.zeros(capacity, np.int32)
+        self.grid_y = np.zeros(capacity, np.int32)
+        self.kind = np.zeros(capacity, np.uint16)
+        self.age = np.zeros(capacity, np.float64)       # Age when the growth clock read synced_at
+        self.synced_at = np.zeros(capacity, np.float64)
+        self.harvested = np.zeros(capacity, np.bool_)
+        self.unsaved: set[Pos] = set()
+
+        # One entry per plant type (indexed by kind)
+        self.kind_ids: list[str] = []
+        self.kind_index: dict[str, int] = {}
+        self.grow_times = np.zeros(0, np.float64)
+        self.is_tree = np.zeros(0, np.bool_)
+        self.regrows = np.zeros(0, np.bool_)
+
+    def __len__(self) -> int:
+        return self.count
+
+    # --- ROWS ---
+    def kind_of(self, plant_id: str) -> int:
+        if (kind := self.kind_index.get(plant_id)) is None:
+            data = ASSETS.plant(plant_id)
+            kind = self.kind_index[plant_id] = len(self.kind_ids)
+            self.kind_ids.append(plant_id)
+            self.grow_times = np.append(self.grow_times, float(data.grow_time))
+            self.is_tree = np.append(self.is_tree, data.is_tree)
+            self.regrows = np.append(self.regrows, data.regrows)
+        return kind
+
+    def add(self, plant_id: str, grid_x: int, grid_y: int, age: float = 0.0,
+            is_harvested: bool = False, synced_at: float | None = None) -> int:
+        """Adds (or overwrites) the crop on a tile, returning its row."""
+        row = self.rows.get((grid_x, grid_y))
+        if row is None:
+            if self.count == len(self.age):
+                self._resize(max(self.count * 2, 64))
+            row = self.rows[(grid_x, grid_y)] = self.count
+            self.count += 1
+            self.grid_x[row], self.grid_y[row] = grid_x, grid_y
+        self.kind[row] = self.kind_of(plant_id)
+        self.age[row] = age
+        self.synced_at[row] = self.plants.growth_time if synced_at is None else synced_at
+        self.harvested[row] = is_harvested
+        self.unsaved.add((grid_x, grid_y))
+        return row
+
+    def load(self, records: list[PlantRecord]) -> None:
+        """Fills the field from a save, without making any sprites. Records keep their own synced_at,
+            so they age up to the plant group's growth clock (set from the same save) by themselves."""
+        for record in records:
+            self.add(record.plant_id, record.grid_x, record.grid_y, record.age, record.is_harvested, record.synced_at)
+        self.unsaved.clear()
+
+    def store(self, plant: Plant) -> None:
+        """Writes a sprite's state back into its row."""
+        self.add(plant.plant_id, plant.grid_x, plant.grid_y, plant.age, plant.is_harvested)
+
+    def sync(self) -> None:
+        """Writes back every sprite changed since the last sync (harvested, newly planted, etc)."""
+        for plant in self.plants.take_unsaved():
+            self.store(plant)
+
+    # --- BULK QUERIES ---
+    def ages(self) -> np.ndarray:
+        """Every crop's current age (PlantData.age_after for every row)."""
+        self.sync()
+        n = self.count
+        grow_times = self.grow_times[self.kind[:n]]
+        return np.minimum(self.age[:n] + (self.plants.growth_time - self.synced_at[:n]), grow_times)
+
+    def stages(self) -> np.ndarray:
+        """Every crop's image stage, matching PlantData.get_stage_index row by row."""
+        ages = self.ages()
+        n = self.count
+        kinds = self.kind[:n]
+        grow_times = self.grow_times[kinds]
+        is_tree, regrows = self.is_tree[kinds], self.regrows[kinds]
+
+        growing_stages = np.where(is_tree, 4, np.where(regrows, 3, 2))
+        growing = np.minimum((ages / grow_times * growing_stages).astype(np.int64), growing_stages - 1)
+        harvested_stage = np.where(regrows & ~is_tree, 2, 3)
+        return np.where(self.harvested[:n], harvested_stage, np.where(ages >= grow_times, growing_stages, growing))
+
+    def ready(self) -> np.ndarray:
+        """A mask of the crops that can be harvested."""
+        ages = self.ages()
+        n = self.count
+        return (ages >= self.grow_times[self.kind[:n]]) & ~self.harvested[:n]
+
+    # --- SPRITES ---
+    def show(self, view_rect: pygame.Rect) -> None:
+        """Keeps sprites for exactly the crops within CROP_FIELD_MARGIN tiles of a world-space view.
+            Only does anything when the view crosses into another tile."""
+        area = (view_rect.left // BLOCK_SIZE - CROP_FIELD_MARGIN, view_rect.top // BLOCK_SIZE - CROP_FIELD_MARGIN,
+                (view_rect.right - 1) // BLOCK_SIZE + CROP_FIELD_MARGIN, (view_rect.bottom - 1) // BLOCK_SIZE + CROP_FIELD_MARGIN)
+        if area == self.area:
+            return
+        self.area = left, top, right, bottom = area
+
+        # --- 1. Fold the sprites that left the area back into the field ---
+        for (grid_x, grid_y), plant in list(self.plants.by_grid.items()):
+            if not (left <= grid_x <= right and top <= grid_y <= bottom):
+                self.hide(plant)
+
+        # --- 2. Make sprites for the crops that came into it ---
+        ages = self.ages()
+        n = self.count
+        grid_x, grid_y = self.grid_x[:n], self.grid_y[:n]
+        inside = np.flatnonzero((grid_x >= left) & (grid_x <= right) & (grid_y >= top) & (grid_y <= bottom))
+        for row, age in zip(inside.tolist(), ages[inside].tolist()):
+            key = (int(self.grid_x[row]), int(self.grid_y[row]))
+            if key not in self.plants.by_grid:
+                self.spawn(row, age)
+
+    def spawn(self, row: int, age: float) -> Plant:
+        plant = self.level.spawn_plant(self.kind_ids[self.kind[row]], int(self.grid_x[row]), int(self.grid_y[row]), *self.groups)
+        plant.age = age
+        plant.is_harvested = bool(self.harvested[row])
+        plant.update_visuals()
+        self.plants.unsaved.discard(plant) # Matches its row
+        return plant
+
+    def hide(self, plant: Plant) -> None:
+        if plant in self.plants.unsaved: # Otherwise the row already ages exactly like the sprite did
+            self.plants.unsaved.discard(plant)
+            self.store(plant)
+        tile = self.level.get_tile(plant.grid_x, plant.grid_y)
+        if tile is not None and tile.occupant is plant: # Otherwise the tile would keep the dead sprite alive
+            tile.occupant = None
+        plant.kill()
+
+    # --- SAVING ---
+    def take_unsaved(self) -> list[PlantRecord]:
+        """Records for the crops changed since the last call (including changed sprites), then clears the list."""
+        self.sync()
+        records = [self.record(self.rows[key]) for key in self.unsaved]
+        self.unsaved.clear()
+        return records
+
+    def records(self) -> list[PlantRecord]:
+        """Every crop, for a full save."""
+        self.sync()
+        self.unsaved.clear() # All covered by the full save
+        n = self.count
+        kind_ids = self.kind_ids
+        return [PlantRecord(kind_ids[kind], grid_x, grid_y, age, is_harvested, synced_at)
+                for kind, grid_x, grid_y, age, is_harvested, synced_at
+                in zip(self.kind[:n].tolist(), self.grid_x[:n].tolist(), self.grid_y[:n].tolist(),
+                       self.age[:n].tolist(), self.harvested[:n].tolist(), self.synced_at[:n].tolist())]
+
+    def record(self, row: int) -> PlantRecord:
+        return PlantRecord(self.kind_ids[self.kind[row]], int(self.grid_x[row]), int(self.grid_y[row]),
+                           float(self.age[row]), bool(self.harvested[row]), float(self.synced_at[row]))
+
+    # --- PRIVATE HELPERS ---
+    def _resize(self, capacity: int) -> None:
+        for name in ("grid_x", "grid_y", "kind", "age", "synced_at", "harvested"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
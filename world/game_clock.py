@@ -0,0 +1,77 @@
+from __future__ import annotations
+import math
+
+# Runtime Imports
+from settings import DAY_LENGTH, GAME_SPEEDS, MINUTES_PER_DAY
+from core.timer_wheel import TimerWheel, TimerEntry, TimerCallback
+
+class GameClock:
+    """ In-game time, counted in game minutes since midnight of day 0. A day lasts DAY_LENGTH real seconds
+    at x1, and speed (one of GAME_SPEEDS) fast-forwards it without doing any more work per frame:
+    events sit in a TimerWheel of one-minute ticks, so a frame only touches the events that come due,
+    and a repeating event that fell several intervals behind runs once, told how many minutes have passed. """
+    def __init__(self, minutes: float = 0.0) -> None:
+        self.events = TimerWheel(tick=1.0)
+        self.events.advance(minutes)
+        self.speed = GAME_SPEEDS[0]
+
+    # --- TIME ---
+    @property
+    def minutes(self) -> float:
+        return self.events.now
+
+    @property
+    def rate(self) -> float:
+        """Game minutes per real second."""
+        return self.rate_at(self.speed)
+
+    @staticmethod
+    def rate_at(speed: float) -> float:
+        return MINUTES_PER_DAY / DAY_LENGTH * speed
+
+    @property
+    def day(self) -> int:
+        return int(self.minutes // MINUTES_PER_DAY)
+
+    @property
+    def time_of_day(self) -> float:
+        """Game minutes since midnight."""
+        return self.minutes % MINUTES_PER_DAY
+
+    @property
+    def night(self) -> float:
+        """0 through the day (06:00 to 18:00), rising to 1 at midnight."""
+        return max(0.0, math.cos(2 * math.pi * self.time_of_day / MINUTES_PER_DAY))
+
+    def __str__(self) -> str:
+        hours, minutes = divmod(int(self.time_of_day), 60)
+        return f"Day {self.day + 1}, {hours:02d}:{minutes:02d}"
+
+    def change_speed(self, steps: int) -> None:
+        """Moves up (or down) the GAME_SPEEDS list."""
+        index = GAME_SPEEDS.index(self.speed) + steps
+        self.speed = GAME_SPEEDS[max(0, min(index, len(GAME_SPEEDS) - 1))]
+
+    # --- EVENTS ---
+    def every(self, interval: float, callback: TimerCallback, at: float | None = None) -> TimerEntry:
+        """Runs the callback every `interval` game minutes, first at the time of day `at` (or one interval from now)."""
+        return self.events.every(interval, callback, None if at is None else self.next_time_of_day(at))
+
+    def after(self, delay: float, callback: TimerCallback) -> TimerEntry:
+        """Runs the callback once, `delay` game minutes from now."""
+        return self.events.after(delay, callback)
+
+    def cancel(self, event: TimerEntry) -> None:
+        self.events.cancel(event)
+
+    def next_time_of_day(self, time_of_day: float) -> float:
+        """The next moment (after now) the clock reads a time of day."""
+        due = self.minutes - self.time_of_day + time_of_day
+        return due if due > self.minutes else due + MINUTES_PER_DAY
+
+    def advance(self, minutes: float) -> None:
+        """Moves the clock on, running every event that comes due (a repeating one runs once, told the minutes passed)."""
+        self.events.advance(minutes)
+
+    def update(self, dt: float) -> None:
+        self.advance(dt * self.rate)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+# Runtime Imports
+from settings import CHUNK_SIZE, USE_NUMPY
+from core.debug_logger import Log
+from world.level import Level, HAS_NUMPY
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    from custom_types import NodeMap
+    from world.chunk import ChunkKey, ChunkRecord
+
+@dataclass
+class PreparedWorld:
+    """Everything the worker thread generated, ready to hand to Level(prepared=...)."""
+    seed: int
+    node_blocks: dict[ChunkKey, NodeMap] = field(default_factory=dict)
+    tile_masks: dict[ChunkKey, tuple[Any, Any, Any]] = field(default_factory=dict) # compute_tile_masks() per chunk
+
+class WorldGenerationJob:
+    """ Generates the node blocks and tile masks around the starting chunk on a worker thread.
+    Only plain data is built here; every pygame Surface is still created on the main thread. """
+    def __init__(self, seed: int, chunk_size: int = CHUNK_SIZE, centre: ChunkKey | None = None,
+                 saved_chunks: dict[ChunkKey, ChunkRecord] | None = None) -> None:
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.use_numpy = HAS_NUMPY and USE_NUMPY
+        self.saved_chunks = saved_chunks or {}
+
+        # The chunks the level loads first, plus the blocks to their right and below (for the masks)
+        self.chunk_keys = Level.chunks_around(centre if centre is not None else Level.spawn_chunk(chunk_size))
+        self.block_keys = sorted({(chunk_x + dx, chunk_y + dy) for chunk_x, chunk_y in self.chunk_keys
+                                  for dx in (0, 1) for dy in (0, 1)})
+
+        # Progress (written by the worker, read by the main thread)
+        self.total = len(self.block_keys) + len(self.chunk_keys)
+        self.completed = 0
+        self.result: PreparedWorld | None = None
+        self.error: Exception | None = None
+
+        self._thread = threading.Thread(target=self._run, name="WorldGeneration", daemon=True)
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None or self.error is not None
+
+    @property
+    def progress(self) -> float:
+        return self.completed / self.total if self.total else 1.0
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            prepared = PreparedWorld(self.seed)
+
+            # --- 1. Node blocks ---
+            generate = Level.generate_node_block_numpy if self.use_numpy else Level.generate_node_block
+            for key in self.block_keys:
+                # Tilled blocks come from the save instead of the generator
+                record = self.saved_chunks.get(key)
+                if record and record.nodes is not None:
+                    prepared.node_blocks[key] = Level.block_from_bytes(record.nodes, self.chunk_size, self.use_numpy)
+                else:
+                    prepared.node_blocks[key] = generate(self.seed, key, self.chunk_size)
+                self.completed += 1
+
+            # --- 2. Tile masks ---
+            blocks = prepared.node_blocks
+            for chunk_x, chunk_y in self.chunk_keys:
+                node_grid = Level.join_node_blocks(blocks[(chunk_x, chunk_y)], blocks[(chunk_x + 1, chunk_y)],
+                                                   blocks[(chunk_x, chunk_y + 1)], blocks[(chunk_x + 1, chunk_y + 1)])
+                prepared.tile_masks[(chunk_x, chunk_y)] = Level.compute_tile_masks(node_grid)
+                self.completed += 1
+
+            self.result = prepared
+        except Exception as error: # Reported to the main thread, which falls back to generating the world itself
+            Log.error(f"World generation thread failed: {error!r}")
+            self.error = error
@@ -2,153 +2,431 @@ from __future__ import annotations
 import random
 import math
 import pygame
-from typing import TYPE_CHECKING, cast
+from array import array
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, cast
 
 # Runtime Imports
-from settings import BLOCK_SIZE, DETAIL_CHANCE
+from settings import BLOCK_SIZE, CHUNK_SIZE, CHUNK_LOAD_RADIUS, CHUNK_UNLOAD_RADIUS, DETAIL_CHANCE, USE_NUMPY
 from core.assets import ASSETS
+from core.assets.asset_data import MarchingLayout
 from core.debug_logger import Log
 from entities.plant import Plant 
-from world.tile import Tile, MapTileGroup
+from world.tile import Tile, TerrainRenderer
+from world.tile_store import TileStore
+from world.chunk import WorldChunk, ChunkRecord, ChunkKey
+
+# Optional Imports
+try:
+    import numpy as np
+except ImportError: # Falls back to the pure Python generator
+    np = None
+HAS_NUMPY = np is not None # The one NumPy check, shared by every module that can use it
 
 # Type-Only Imports
 if TYPE_CHECKING:
     from entities.player import Player
     from groups.plant_group import PlantGroup
-    from groups.camera import CameraGroup
-    from custom_types import NodeMap
+    from custom_types import NodeMap, Group
+    from world.generation import PreparedWorld
 
 class Level:
     DIRT_NODE = 0
     GRASS_NODE = 1
     WATER_NODE = 2
-    """ Handles level initialization by processing a node map (corner statuses)
-    and generating high-resolution Marching Squares tiles. """
+    """ Handles the streamed world: node-map chunks are generated from the seed as the player 
+    approaches, turned into Marching Squares tiles, and evicted again once they are far away. """
+
+    # Procedural terrain: every BLOB_CELL x BLOB_CELL square of nodes gets its own dirt patches
+    BLOB_CELL:int = 32
+    BLOBS: tuple[tuple[int, int], ...] = ((8, 4), (4, 1), (4, 0)) # (radius, padding) of each patch
+    SPAWN_TILE: tuple[int, int] = (1, 1)
 
-    def __init__(self, plant_group: PlantGroup, player_sprite: Player, map_data: NodeMap | None = None) -> None:
+    def __init__(self, plant_group: PlantGroup, player_sprite: Player, map_data: NodeMap | None = None, 
+                 seed: int | None = None, prepared: PreparedWorld | None = None, 
+                 saved_chunks: dict[ChunkKey, ChunkRecord] | None = None, spawn_pos: tuple[int, int] | None = None) -> None:
         self.tilesets = ASSETS.tiles.storage
-        self.all_tiles = MapTileGroup()
+        
+        # The world seed drives every random choice, so a seed always rebuilds the same level
+        if seed is None:
+            seed = prepared.seed if prepared else random.randrange(2**32)
+        self.seed: int = seed
+        self.chunk_size = CHUNK_SIZE
+        self.renderer = TerrainRenderer(self, self.chunk_size)
         
         self.plant_group = plant_group
         self.player_sprite = player_sprite
+
+        # Loaded state (chunk keys are (chunk_x, chunk_y), see WorldChunk)
+        self.chunks: dict[ChunkKey, WorldChunk] = {}   # Materialised tiles around the player
+        self.node_blocks: dict[ChunkKey, NodeMap] = {} # Each chunk's own nodes (also kept for the neighbours of loaded chunks)
+        self.modified_chunks: set[ChunkKey] = set()    # Loaded chunks whose tile flags have changed
+        self.modified_blocks: set[ChunkKey] = set()    # Node blocks that have been tilled
+        self.unsaved_chunks: set[ChunkKey] = set()     # Chunks changed since the last autosave (tiles or nodes)
         
-        self.tile_grid: dict[tuple[int, int], Tile] = {}
+        # The mutated state of evicted chunks, restored when they load again
+        self.saved_chunks: dict[ChunkKey, ChunkRecord] = dict(saved_chunks or {})
+
+        # Node blocks and masks made ahead of time by a WorldGenerationJob (used as the chunks load)
+        self.prepared_masks: dict[ChunkKey, tuple[Any, Any, Any]] = {}
+        if prepared and prepared.seed == self.seed and map_data is None:
+            self.node_blocks.update(prepared.node_blocks)
+            self.prepared_masks.update(prepared.tile_masks)
         
-        if map_data:
+        # A fixed map is surrounded by water, and only the chunks over it are loaded
+        self.fixed_map = map_data
+        self.bounds: pygame.Rect | None = None # In tiles
+        if map_data is not None:
             Log.info("loading existing map data")
-            self.node_map = map_data
+            self.bounds = pygame.Rect(0, 0, (len(map_data[0]) - 1) // 2, (len(map_data) - 1) // 2)
+            self.use_numpy = HAS_NUMPY and isinstance(map_data, np.ndarray)
         else:
-            Log.info("Generating new procdural Map")
-            self.node_map = self.create_node_map(map_size=32)
-
-        # The tile map dimensions are 2 less than the node map dimensions
-        self.MAP_HEIGHT = len(self.node_map) - 2
-        self.MAP_WIDTH = len(self.node_map[0]) - 2 
+            Log.info(f"Streaming procedural world (seed: {self.seed})")
+            self.use_numpy = HAS_NUMPY and USE_NUMPY
 
-        self.generate_level()
+        # Place Player (on the spawn tile, or where they were saved), then load the world around them
+        if spawn_pos is not None:
+            self.player_sprite.hitbox.center = spawn_pos
+            self.player_sprite.finalize_movement()
+        else:
+            self.player_sprite.rect.topleft = (self.SPAWN_TILE[0] * BLOCK_SIZE, self.SPAWN_TILE[1] * BLOCK_SIZE)
+        self.player_sprite.store_previous_position() # Don't slide in from where the player was made
+        self.stream_chunks()
+        Log.success(f"World ready: {len(self.chunks)} chunks loaded around the player.")
 
     @property
     def tile_list(self) -> list[Tile]:
-        """A strictly-typed list of all active tiles in the level.
-        Use this for collision and iteration instead of the raw Sprite Group."""
-        return cast(list[Tile], self.all_tiles.sprites())
+        """A view of every loaded tile. This builds one view per tile, 
+        so prefer get_tile() or tiles_in_rect() anywhere that runs often."""
+        tiles = []
+        for chunk in self.chunks.values():
+            cols, rows = chunk.grid_range
+            tiles.extend(chunk.tile(self, x, y) for y in rows for x in cols)
+        return tiles
 
     def update(self, dt) -> None:
-        self.all_tiles.update()
+        # Tiles have no per-frame logic; the only work is keeping the right chunks loaded
+        self.stream_chunks()
+
+    def draw(self, view_rect: pygame.Rect) -> None:
+        self.renderer.custom_draw(view_rect)
+
+    # --- CHUNK STREAMING ---
+    def chunk_key(self, grid_x: int, grid_y: int) -> ChunkKey:
+        return (grid_x // self.chunk_size, grid_y // self.chunk_size)
+
+    @staticmethod
+    def spawn_chunk(chunk_size: int = CHUNK_SIZE) -> ChunkKey:
+        return (Level.SPAWN_TILE[0] // chunk_size, Level.SPAWN_TILE[1] // chunk_size)
 
-    def draw(self, camera_offset: pygame.math.Vector2) -> None:
-        self.all_tiles.custom_draw(camera_offset)
+    @staticmethod
+    def pixel_to_chunk(pos: tuple[int, int], chunk_size: int = CHUNK_SIZE) -> ChunkKey:
+        chunk_pixels = chunk_size * BLOCK_SIZE
+        return (int(pos[0]) // chunk_pixels, int(pos[1]) // chunk_pixels)
+
+    @staticmethod
+    def chunks_around(centre: ChunkKey, radius: int = CHUNK_LOAD_RADIUS) -> list[ChunkKey]:
+        """Every chunk key within a (square) radius of a chunk, row by row."""
+        centre_x, centre_y = centre
+        return [(chunk_x, chunk_y) for chunk_y in range(centre_y - radius, centre_y + radius + 1)
+                for chunk_x in range(centre_x - radius, centre_x + radius + 1)]
+
+    def in_bounds(self, key: ChunkKey) -> bool:
+        """Procedural worlds go on forever; fixed maps only load the chunks that overlap them."""
+        if self.bounds is None:
+            return True
+        size = self.chunk_size
+        return self.bounds.colliderect(pygame.Rect(key[0] * size, key[1] * size, size, size))
+
+    def stream_chunks(self) -> None:
+        """Loads the chunks within CHUNK_LOAD_RADIUS of the player, and evicts those past CHUNK_UNLOAD_RADIUS.
+            The gap between the two stops chunks thrashing as the player walks back and forth over a border."""
+        centre_x, centre_y = self.pixel_to_chunk(self.player_sprite.rect.center, self.chunk_size)
+
+        def distance(key: ChunkKey) -> int:
+            return max(abs(key[0] - centre_x), abs(key[1] - centre_y))
 
-    def generate_level(self) -> None:
-        """ Iterates over the node map to calculate the 9-node status for each 
-        64x64 tile and creates the Tile object. """
-        self.all_tiles.empty() # Clear existing tiles
-        self.tile_grid.clear()
+        # --- 1. Evict far chunks (node blocks are kept one ring further, as the chunks to their left and above use them) ---
+        for key in [key for key in self.chunks if distance(key) > CHUNK_UNLOAD_RADIUS]:
+            self.evict_chunk(key)
+        for key in [key for key in self.node_blocks if distance(key) > CHUNK_UNLOAD_RADIUS + 1]:
+            self.evict_node_block(key)
+
+        # --- 2. Load any missing chunks near the player ---
+        for key in self.chunks_around((centre_x, centre_y)):
+            if key not in self.chunks and self.in_bounds(key):
+                self.load_chunk(key)
+
+    def load_chunk(self, key: ChunkKey) -> WorldChunk:
+        """Materialises the tiles of one chunk, restoring any saved state."""
+        chunk = WorldChunk(key, self.chunk_size)
+        tile_masks = self.prepared_masks.pop(key, None) or self.compute_tile_masks(self.chunk_node_grid(key))
+        self.fill_tiles(chunk, *tile_masks)
         
-        # Initialize the screen tile counters
-        map_tile_x = 0
-        map_tile_y = 0
-
-        # We iterate over the tile coordinates (which range from 0 to MAP_SIZE-1)
-        for node_y in range(0, self.MAP_HEIGHT, 2):
-            map_tile_x = 0 # Reset tile X index for each new row
-            for node_x in range(0, self.MAP_WIDTH, 2):
-                
-                # --- 1. Extract the 9-Node Status ---
-                # The current tile at (tile_x, tile_y) is influenced by a 3x3 node grid 
-                # starting at node (tile_x, tile_y) and ending at (tile_x + 2, tile_y + 2).
-                nine_nodes_status: list[bool] = []
-                same_type_count = 0
-                # The primary material is based on the center node of the 3x3 grid
-                center_node_material = self.node_map[node_y + 1][node_x + 1]
-                for y_offset in range(3):
-                    for x_offset in range(3):
-                        # Accesses node_map[node_y + y_offset][node_x + x_offset]
-                        node_value = self.node_map[node_y + y_offset][node_x + x_offset]
-                        nine_nodes_status.append(node_value == Level.GRASS_NODE)
-
-                        if node_value == center_node_material:
-                            same_type_count += 1
-
-                # --- 2. Calculate Screen Position (CORRECTED) ---
-                # Use the simple map tile index (0, 1, 2, 3...) for screen position
-                x = map_tile_x * BLOCK_SIZE
-                y = map_tile_y * BLOCK_SIZE
-
-                detail_key: str | None = None
-                random_detail_image: pygame.Surface | None = None
-                
-                # If dirt, use the DIRT tileset and Dirt details
-                if center_node_material == Level.DIRT_NODE:
-                    tile_type_key = "DIRT"
-                    detail_key = "DETAIL_DIRT" 
-
-                # If grass, randomly choose between GRASS_A and GRASS_B tilesets
-                elif center_node_material == Level.GRASS_NODE:
-                    tile_type_key = "GRASS_A"
-                    detail_key = "DETAIL_GRASS"
-                
-                # Handle other types like WATER or fallback
-                else: 
-                    tile_type_key = "WATER" 
-                
-                # Check if we have a detail key and the random chance succeeds
-                if detail_key and same_type_count >= 6 and random.random() < DETAIL_CHANCE:
-                    detail_list = self.tilesets.get(detail_key)
-                    
-                    if detail_list:
-                        # Select a random image from the list of details for this ground type
-                        random_detail_image = random.choice(detail_list)
+        record = self.saved_chunks.get(key)
+        if record and record.flags is not None:
+            chunk.tiles.flags = array("B", record.flags)
 
-                # --- 3. Create the Marching Tile ---
-                new_tile = Tile.create(self, x, y, tile_type_key, nine_nodes_status, self.all_tiles, random_detail_image)
-                
-                self.tile_grid[(map_tile_x, map_tile_y)] = new_tile
+        # Re-link any plants standing in this chunk
+        span = self.chunk_size * BLOCK_SIZE
+        for plant in self.plant_group.plants_in_rect(pygame.Rect(key[0] * span, key[1] * span, span, span)):
+            chunk.tiles.set_occupant(chunk.index(plant.grid_x, plant.grid_y), plant)
+
+        self.chunks[key] = chunk
+        return chunk
+
+    def evict_chunk(self, key: ChunkKey) -> None:
+        """Drops a chunk's tiles (and baked surfaces), saving its flags first if they have changed."""
+        chunk = self.chunks.pop(key)
+        if key in self.modified_chunks:
+            self.modified_chunks.discard(key)
+            self.saved_chunks.setdefault(key, ChunkRecord()).flags = chunk.tiles.flags.tobytes()
+        self.renderer.drop_chunk(key)
+
+    def evict_node_block(self, key: ChunkKey) -> None:
+        """Drops a chunk's nodes, saving them first if they have been tilled."""
+        block = self.node_blocks.pop(key)
+        if key in self.modified_blocks:
+            self.modified_blocks.discard(key)
+            self.saved_chunks.setdefault(key, ChunkRecord()).nodes = self.block_to_bytes(block)
+
+    def chunk_record(self, key: ChunkKey) -> ChunkRecord:
+        """The current saved state of one chunk, whether it is loaded or not."""
+        saved = self.saved_chunks.get(key) or ChunkRecord()
+        nodes = self.block_to_bytes(self.node_blocks[key]) if key in self.modified_blocks else saved.nodes
+        flags = self.chunks[key].tiles.flags.tobytes() if key in self.modified_chunks else saved.flags
+        return ChunkRecord(nodes, flags)
+
+    def chunk_records(self) -> dict[ChunkKey, ChunkRecord]:
+        """A snapshot of every chunk that differs from the generated world (for saving),
+            including loaded chunks that have changed since they were loaded."""
+        keys = self.saved_chunks.keys() | self.modified_blocks | self.modified_chunks
+        return {key: self.chunk_record(key) for key in keys}
+
+    def take_unsaved_chunks(self) -> dict[ChunkKey, ChunkRecord]:
+        """Records for just the chunks changed since the last call (for autosaving), then clears the list."""
+        records = {}
+        for key in self.unsaved_chunks:
+            record = self.chunk_record(key)
+            records[key] = ChunkRecord(None if record.nodes is None else bytes(record.nodes),
+                                       None if record.flags is None else bytes(record.flags))
+        self.unsaved_chunks.clear()
+        return records
+
+    def mark_tile_changed(self, grid_x: int, grid_y: int) -> None:
+        """Called by tiles when their stored state changes, so the chunk is redrawn and saved on eviction."""
+        self.renderer.mark_dirty(grid_x, grid_y)
+        self.modified_chunks.add(self.chunk_key(grid_x, grid_y))
+        self.unsaved_chunks.add(self.chunk_key(grid_x, grid_y))
+
+    def dry_soil(self) -> int:
+        """Dries every watered tile, loaded or not (each morning). Returns how many chunks had wet soil."""
+        watered, dried = TileStore.WATERED, 0
+        for chunk in self.chunks.values():
+            flags = chunk.tiles.flags
+            cols, rows = chunk.grid_range
+            wet = [index for index, value in enumerate(flags) if value & watered]
+            for index in wet:
+                flags[index] &= ~watered
+                self.mark_tile_changed(cols[index % chunk.size], rows[index // chunk.size])
+            dried += bool(wet)
+
+        # Evicted chunks only exist as saved flags
+        for key, record in self.saved_chunks.items():
+            if key not in self.chunks and record.flags is not None and any(value & watered for value in record.flags):
+                record.flags = bytes(value & ~watered for value in record.flags)
+                self.unsaved_chunks.add(key)
+                dried += 1
+        return dried
+
+    def fill_tiles(self, chunk: WorldChunk, mask_grid: Any, center_grid: Any, same_type_grid: Any) -> None:
+        """ Fills a chunk's TileStore arrays from its mask, center and same-type grids (see compute_tile_masks). """
+        tiles = chunk.tiles
+        
+        # --- 1. Tile types and flags, from the center node material ---
+        # DIRT_NODE -> DIRT, GRASS_NODE -> GRASS_A, anything else -> WATER
+        water_id = TileStore.TYPE_IDS["WATER"]
+        type_lookup = [water_id] * 256
+        type_lookup[Level.DIRT_NODE] = TileStore.TYPE_IDS["DIRT"]
+        type_lookup[Level.GRASS_NODE] = TileStore.TYPE_IDS["GRASS_A"]
+        flag_lookup = [TileStore.OBSTRUCTED if type_id == water_id else TileStore.TILLABLE for type_id in type_lookup]
+
+        if HAS_NUMPY and isinstance(mask_grid, np.ndarray):
+            tiles.load_grid(tiles.masks, mask_grid)
+            tiles.load_grid(tiles.types, np.array(type_lookup, dtype=np.uint8)[center_grid])
+            tiles.load_grid(tiles.flags, np.array(flag_lookup, dtype=np.uint8)[center_grid])
+            
+            # Only tiles surrounded by their own material can get a detail
+            detail_candidates = np.flatnonzero((same_type_grid >= 6) & (center_grid <= Level.GRASS_NODE)).tolist()
+            center_flat = center_grid.ravel().tolist()
+        else:
+            tiles.load_grid(tiles.masks, mask_grid)
+            tiles.load_grid(tiles.types, [[type_lookup[c] for c in row] for row in center_grid])
+            tiles.load_grid(tiles.flags, [[flag_lookup[c] for c in row] for row in center_grid])
+            
+            center_flat = [c for row in center_grid for c in row]
+            same_type_flat = [n for row in same_type_grid for n in row]
+            detail_candidates = [i for i, (c, n) in enumerate(zip(center_flat, same_type_flat)) 
+                                 if n >= 6 and c <= Level.GRASS_NODE]
+
+        # --- 2. Scatter Details (Pebbles, flowers, etc.) ---
+        # Rolled from the seed and grid position, so a chunk gets the same details every time it loads
+        for index in detail_candidates:
+            grid_x, grid_y = chunk.origin_x + index % chunk.size, chunk.origin_y + index // chunk.size
+            
+            # If dirt, use the Dirt details, otherwise use the Grass details
+            detail_key = "DETAIL_DIRT" if center_flat[index] == Level.DIRT_NODE else "DETAIL_GRASS"
+            
+            # Check the random chance succeeds
+            if MarchingLayout.variant_hash(self.seed, grid_x, grid_y, 1) / 2**32 < DETAIL_CHANCE:
+                detail_list = self.tilesets.get(detail_key)
                 
-                # --- 4. Place Player (using the map_tile_x/y indices) ---
-                if map_tile_x == 1 and map_tile_y == 1:
-                    self.player_sprite.rect.topleft = (x, y)
-                    
-                # --- 5. Increment Map Tile Index ---
-                map_tile_x += 1 # Advance the screen position counter by 1
-            map_tile_y += 1 # Advance the screen position counter to the next row
+                if detail_list:
+                    # Store which detail image to use (0 means no detail)
+                    tiles.details[index] = MarchingLayout.variant_hash(self.seed, grid_x, grid_y, 2) % len(detail_list) + 1
+
+    # --- NODES ---
+    def get_node_block(self, key: ChunkKey) -> NodeMap:
+        """Returns a chunk's own nodes, restoring or generating them on first use."""
+        block = self.node_blocks.get(key)
+        if block is None:
+            record = self.saved_chunks.get(key)
+            if record and record.nodes is not None:
+                block = self.block_from_bytes(record.nodes, self.chunk_size, self.use_numpy)
+            elif self.fixed_map is not None:
+                block = self.slice_fixed_map(key)
+            elif self.use_numpy:
+                block = self.generate_node_block_numpy(self.seed, key, self.chunk_size)
+            else:
+                block = self.generate_node_block(self.seed, key, self.chunk_size)
+            self.node_blocks[key] = block
+        return block
+
+    def chunk_node_grid(self, key: ChunkKey) -> NodeMap:
+        """The (2 * size + 1) square of nodes a chunk's tiles sit on: its own block, 
+            plus the first column and row of the blocks to its right and below."""
+        chunk_x, chunk_y = key
+        return self.join_node_blocks(*(self.get_node_block(k) for k in 
+                                       (key, (chunk_x + 1, chunk_y), (chunk_x, chunk_y + 1), (chunk_x + 1, chunk_y + 1))))
+
+    @staticmethod
+    def join_node_blocks(block: Any, right: Any, below: Any, corner: Any) -> NodeMap:
+        """Adds the first column of the block to the right, and the first row of the blocks below."""
+        if HAS_NUMPY and isinstance(block, np.ndarray):
+            top = np.hstack((block, right[:, :1]))
+            bottom = np.hstack((below[:1], corner[:1, :1]))
+            return np.vstack((top, bottom))
+
+        node_grid = [row + [right_row[0]] for row, right_row in zip(block, right)]
+        node_grid.append(below[0] + [corner[0][0]])
+        return node_grid
+
+    def get_node(self, node_x: int, node_y: int) -> int | None:
+        """The material of one node, or None if its chunk isn't loaded."""
+        span = self.chunk_size * 2
+        block = self.node_blocks.get((node_x // span, node_y // span))
+        if block is None:
+            return None
+        return int(block[node_y % span][node_x % span])
+
+    def set_node(self, node_x: int, node_y: int, material: int) -> None:
+        span = self.chunk_size * 2
+        key = (node_x // span, node_y // span)
+        block = self.node_blocks.get(key)
+        if block is not None:
+            block[node_y % span][node_x % span] = material
+            self.modified_blocks.add(key)
+            self.unsaved_chunks.add(key)
+
+    def block_to_bytes(self, block: NodeMap) -> bytes:
+        if HAS_NUMPY and isinstance(block, np.ndarray):
+            return block.astype(np.uint8).tobytes()
+        return bytes(node for row in block for node in row)
+
+    @staticmethod
+    def block_from_bytes(data: bytes | memoryview, chunk_size: int, use_numpy: bool) -> NodeMap:
+        span = chunk_size * 2
+        if use_numpy:
+            return np.frombuffer(data, dtype=np.uint8).reshape(span, span).copy()
+        return [list(data[row * span:(row + 1) * span]) for row in range(span)]
+
+    def slice_fixed_map(self, key: ChunkKey) -> NodeMap:
+        """Cuts a chunk's nodes out of the fixed map. Anything past its edges is water."""
+        span = self.chunk_size * 2
+        node_map = cast(Any, self.fixed_map)
+        bounds = cast(pygame.Rect, self.bounds)
+        x0, y0 = key[0] * span, key[1] * span
+        
+        # Only the nodes under whole tiles are used (a map N nodes wide holds (N - 1) // 2 tiles)
+        rows, cols = bounds.height * 2 + 1, bounds.width * 2 + 1
+        
+        if self.use_numpy:
+            block = np.full((span, span), Level.WATER_NODE, dtype=np.uint8)
+            top, bottom = max(0, y0), min(rows, y0 + span)
+            left, right = max(0, x0), min(cols, x0 + span)
+            if top < bottom and left < right:
+                block[top - y0:bottom - y0, left - x0:right - x0] = node_map[top:bottom, left:right]
+            return block
+        
+        return [[node_map[y][x] if 0 <= y < rows and 0 <= x < cols else Level.WATER_NODE 
+                 for x in range(x0, x0 + span)] for y in range(y0, y0 + span)]
+
+    @staticmethod
+    def compute_tile_masks(node_map: NodeMap) -> tuple[Any, Any, Any]:
+        """Calculates, for every tile at once: 
+            - the 9-bit grass mask (bit = y_offset * 3 + x_offset, set if that node is grass),
+            - the center node material (which decides the tile type),
+            - how many of the 9 nodes match the center material.
+        Tile (tx, ty) is influenced by the 3x3 node grid starting at node (2*tx, 2*ty).
+        Returns three 2D grids: NumPy arrays for a NumPy node map, otherwise lists of lists."""
+        rows, cols = len(node_map), len(node_map[0])
+        height, width = (rows - 1) // 2, (cols - 1) // 2
+        offsets = [(y_offset, x_offset) for y_offset in range(3) for x_offset in range(3)]
+
+        if HAS_NUMPY and isinstance(node_map, np.ndarray):
+            # Strided views: every tile's center node, then every tile's node at each offset
+            center_grid = node_map[1:2 * height:2, 1:2 * width:2]
+            mask_grid = np.zeros((height, width), dtype=np.uint16)
+            same_type_grid = np.zeros((height, width), dtype=np.uint8)
             
-        # --- Final Dimension Calculation ---
-        # Recalculate dimensions based on the tiles actually generated
-        self.MAP_WIDTH = map_tile_x 
-        self.MAP_HEIGHT = map_tile_y
-        Log.success(f"Level generated: {self.MAP_WIDTH}x{self.MAP_HEIGHT} tiles.")
+            for bit, (y_offset, x_offset) in enumerate(offsets):
+                nodes = node_map[y_offset:y_offset + 2 * height:2, x_offset:x_offset + 2 * width:2]
+                mask_grid |= (nodes == Level.GRASS_NODE).astype(np.uint16) << bit
+                same_type_grid += (nodes == center_grid)
+            return mask_grid, center_grid.copy(), same_type_grid
+
+        # Pure Python fallback
+        mask_grid, center_grid, same_type_grid = [], [], []
+        for tile_y in range(height):
+            mask_row, center_row, same_type_row = [], [], []
+            for tile_x in range(width):
+                node_y, node_x = tile_y * 2, tile_x * 2
+                center = node_map[node_y + 1][node_x + 1]
+                mask = same_type_count = 0
+                for bit, (y_offset, x_offset) in enumerate(offsets):
+                    node_value = node_map[node_y + y_offset][node_x + x_offset]
+                    if node_value == Level.GRASS_NODE:
+                        mask |= 1 << bit
+                    if node_value == center:
+                        same_type_count += 1
+                mask_row.append(mask)
+                center_row.append(center)
+                same_type_row.append(same_type_count)
+            mask_grid.append(mask_row)
+            center_grid.append(center_row)
+            same_type_grid.append(same_type_row)
+        return mask_grid, center_grid, same_type_grid
 
     def till_map_node(self, grid_x: int, grid_y: int) -> None:
         """Converts a grass grid tile into dirt and updates the surrounding visuals."""
         node_cx = (grid_x * 2) + 1
         node_cy = (grid_y * 2) + 1
         
-        if node_cx >= len(self.node_map[0]) or node_cy >= len(self.node_map):
+        if self.get_node(node_cx, node_cy) is None:
             return
 
         # 1. Turn the center node to dirt
-        self.node_map[node_cy][node_cx] = Level.DIRT_NODE
+        self.set_node(node_cx, node_cy, Level.DIRT_NODE)
         
         # Keep track of which tiles need their images redrawn
         tiles_to_refresh: set[tuple[int, int]] = {(grid_x, grid_y)}
@@ -160,7 +438,7 @@ class Level:
             adj_tile = self.get_tile(grid_x + dx, grid_y + dy)
             if getattr(adj_tile, 'is_tilled', False):
                 # If the neighbor is also tilled, turn the shared edge into dirt!
-                self.node_map[node_cy + ndy][node_cx + ndx] = Level.DIRT_NODE
+                self.set_node(node_cx + ndx, node_cy + ndy, Level.DIRT_NODE)
                 tiles_to_refresh.add((grid_x + dx, grid_y + dy))
 
         # 3. Check Diagonals (Fills in the inner corners so you get perfect squares)
@@ -171,31 +449,46 @@ class Level:
             if getattr(adj_tile, 'is_tilled', False) and \
                getattr(self.get_tile(grid_x + dx, grid_y), 'is_tilled', False) and \
                getattr(self.get_tile(grid_x, grid_y + dy), 'is_tilled', False):
-                self.node_map[node_cy + ndy][node_cx + ndx] = Level.DIRT_NODE
+                self.set_node(node_cx + ndx, node_cy + ndy, Level.DIRT_NODE)
                 tiles_to_refresh.add((grid_x + dx, grid_y + dy))
 
         # 4. Tell the affected tiles to redraw themselves!
         for tx, ty in tiles_to_refresh:
             tile = self.get_tile(tx, ty)
             if tile and getattr(tile, 'tile_type_key', None) != "WATER":
-                tcx, tcy = (tx * 2) + 1, (ty * 2) + 1
-                new_nodes = []
-                for ny in range(3):
-                    for nx in range(3):
-                        try:
-                            val = self.node_map[tcy - 1 + ny][tcx - 1 + nx]
-                            new_nodes.append(val == Level.GRASS_NODE)
-                        except IndexError:
-                            new_nodes.append(False) 
-                
-                tile.refresh_terrain(new_nodes)
+                tile.refresh_terrain(self.get_tile_mask(tx, ty))
+
+    def get_tile_mask(self, grid_x: int, grid_y: int) -> int:
+        """Re-reads the 9-bit grass mask for one tile from the node map.
+            Bits run left-to-right, top-to-bottom; nodes that aren't loaded count as not grass."""
+        node_x, node_y = grid_x * 2, grid_y * 2
+        mask = 0
+        for bit in range(9):
+            if self.get_node(node_x + bit % 3, node_y + bit // 3) == Level.GRASS_NODE:
+                mask |= 1 << bit
+        return mask
 
     def get_tile(self, grid_x:int, grid_y:int) -> Tile|None:
-        return self.tile_grid.get((grid_x, grid_y))
+        """Returns a view of the tile at this grid position, or None if its chunk isn't loaded."""
+        chunk = self.chunks.get(self.chunk_key(grid_x, grid_y))
+        if chunk is None:
+            return None
+        return chunk.tile(self, grid_x, grid_y)
+
+    def tiles_in_rect(self, rect: pygame.Rect) -> list[Tile]:
+        """Views of every loaded tile touching a world-space rect, found by grid maths (no scanning)."""
+        tiles = []
+        for grid_y in range(rect.top // BLOCK_SIZE, (rect.bottom - 1) // BLOCK_SIZE + 1):
+            for grid_x in range(rect.left // BLOCK_SIZE, (rect.right - 1) // BLOCK_SIZE + 1):
+                tile = self.get_tile(grid_x, grid_y)
+                if tile:
+                    tiles.append(tile)
+        return tiles
     
-    def spawn_plant(self, plant_name: str, grid_x: int, grid_y: int, camera_group: CameraGroup) -> Plant:
-        # Create new plant, with groups
-        new_plant = Plant(plant_name, grid_x, grid_y, camera_group, self.plant_group)
+    def spawn_plant(self, plant_name: str, grid_x: int, grid_y: int, *groups: Group) -> Plant:
+        # Create new plant, with groups (the camera and collision world) plus the level's plant group
+        # (a plant already on this tile is killed and replaced, see PlantGroup.add_internal)
+        new_plant = Plant(plant_name, grid_x, grid_y, *groups, self.plant_group)
         
         # Link to the tile
         tile = self.get_tile(grid_x, grid_y)
@@ -204,62 +497,75 @@ class Level:
         
         return new_plant
     @staticmethod
-    def draw_blob(node_map: list[list[int]], radius: int, passive_material: int, padding: int = 4) -> None:
-        """Randomly selects a center point, calculates a noise-distorted boundary, 
-        and sets nodes within that boundary to the passive_material."""
-        map_size = len(node_map)
-
-        # Calculate Safe Boundaries for the Center
-        min_coord = radius + padding
-        max_coord = map_size - 1 - radius - padding
-
-        # Select Random Center Point (Safety check added for impossible boundaries)
-        if min_coord > max_coord:
-            return 
-            
-        center_x = random.randint(min_coord, max_coord)
-        center_y = random.randint(min_coord, max_coord)
+    def blobs_near(seed: int, x0: int, y0: int, span: int) -> Iterator[tuple[int, int, int]]:
+        """Yields (center_x, center_y, radius) for every dirt patch that could reach a square of nodes.
+            Each BLOB_CELL square of the world places its own patches from a hash of the seed and its position,
+            so any part of the world can be generated without generating its neighbours."""
+        cell = Level.BLOB_CELL
+        reach = max(radius for radius, _ in Level.BLOBS) + 2 # A patch's bounding box margin
         
-        # Iterate over a bounding box
-        for y in range(max(0, center_y - radius - 2), min(map_size, center_y + radius + 3)):
-            for x in range(max(0, center_x - radius - 2), min(map_size, center_x + radius + 3)):
-                
-                # 1. Calculate the distance squared from the center
-                distance_sq = (x - center_x)**2 + (y - center_y)**2
-                
-                # 2. Calculate the Noise Value (The key to distortion)
-                angle = math.atan2(y - center_y, x - center_x)
-                
-                # Base Distortion: A smooth wave based on the angle (3 cycles around the circle)
-                distortion = math.cos(angle * 3) * 0.5 
-                
-                # Add subtle high-frequency randomness for texture
-                noise_factor = (distortion + random.random() * 0.5) * 2
-                
-                # Determine the effective radius for this point
-                effective_radius = radius + noise_factor
-                
-                # Check against the effective radius squared
-                if distance_sq < effective_radius**2:
-                    node_map[y][x] = passive_material
+        for cell_y in range((y0 - reach) // cell, (y0 + span - 1 + reach) // cell + 1):
+            for cell_x in range((x0 - reach) // cell, (x0 + span - 1 + reach) // cell + 1):
+                rng = random.Random(MarchingLayout.variant_hash(seed, cell_x, cell_y))
+                for radius, padding in Level.BLOBS:
+                    low, high = radius + padding, cell - 1 - radius - padding
+                    yield (cell_x * cell + rng.randint(low, high), cell_y * cell + rng.randint(low, high), radius)
+
     @staticmethod
-    def create_node_map(map_size: int = 32, active: int = 1, passive: int = 0) -> NodeMap:
-        """Generates the initial node map with grass, dirt patches, and a pond."""
-        # Initialize the entire map grid to the active material (Grass = 1)
-        node_map = [[active for _ in range(map_size)] for _ in range(map_size)]
+    def generate_node_block(seed: int, key: tuple[int, int], chunk_size: int) -> list[list[int]]:
+        """Generates the (2 * chunk_size) square of nodes owned by one chunk: grass with noise-distorted dirt patches.
+            The noise is hashed from each node's position, so blocks always join up seamlessly."""
+        span = chunk_size * 2
+        x0, y0 = key[0] * span, key[1] * span
+        block = [[Level.GRASS_NODE] * span for _ in range(span)]
         
-        # Carve out Dirt Patches (Setting nodes to 0)
-        Level.draw_blob(node_map, radius=8, passive_material=passive)
-        Level.draw_blob(node_map, radius=4, passive_material=passive, padding=1)
-        Level.draw_blob(node_map, radius=4, passive_material=passive, padding=0)
-
-        # Add a Random Pond (WATER_NODE = 2)
-        #Level.draw_pond(node_map, min_radius=6, max_radius=10)
-        Log.success("Node map created.")
-        return node_map
-    
-    
-    
+        for center_x, center_y, radius in Level.blobs_near(seed, x0, y0, span):
+            for y in range(max(y0, center_y - radius - 2), min(y0 + span, center_y + radius + 3)):
+                for x in range(max(x0, center_x - radius - 2), min(x0 + span, center_x + radius + 3)):
+                    distance_sq = (x - center_x)**2 + (y - center_y)**2
+                    
+                    # A smooth wave around the circle (3 cycles), plus per-node noise for texture
+                    distortion = math.cos(math.atan2(y - center_y, x - center_x) * 3) * 0.5
+                    noise_factor = (distortion + MarchingLayout.variant_hash(seed, x, y) / 2**32 * 0.5) * 2
+                    
+                    if distance_sq < (radius + noise_factor)**2:
+                        block[y - y0][x - x0] = Level.DIRT_NODE
+        return block
+
+    @staticmethod
+    def generate_node_block_numpy(seed: int, key: tuple[int, int], chunk_size: int) -> np.ndarray:
+        """Vectorised generate_node_block (the per-node hash is computed for a whole patch at once)."""
+        span = chunk_size * 2
+        x0, y0 = key[0] * span, key[1] * span
+        block = np.full((span, span), Level.GRASS_NODE, dtype=np.uint8)
+        
+        for center_x, center_y, radius in Level.blobs_near(seed, x0, y0, span):
+            top, bottom = max(y0, center_y - radius - 2), min(y0 + span, center_y + radius + 3)
+            left, right = max(x0, center_x - radius - 2), min(x0 + span, center_x + radius + 3)
+            if top >= bottom or left >= right:
+                continue
+            
+            ys, xs = np.ogrid[top:bottom, left:right]
+            dy, dx = ys - center_y, xs - center_x
+            distance_sq = dx**2 + dy**2
+            distortion = np.cos(np.arctan2(dy, dx) * 3) * 0.5
+            noise_factor = (distortion + Level.node_noise_numpy(seed, xs, ys) * 0.5) * 2
+            
+            block[top - y0:bottom - y0, left - x0:right - x0][distance_sq < (radius + noise_factor)**2] = Level.DIRT_NODE
+        return block
+
+    @staticmethod
+    def node_noise_numpy(seed: int, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """MarchingLayout.variant_hash(seed, x, y) / 2**32 for a grid of nodes, using wrapping uint32 maths."""
+        h = np.full(np.broadcast_shapes(xs.shape, ys.shape), 0x811C9DC5, dtype=np.uint32)
+        for value in (np.int64(seed & 0xFFFFFFFF), xs, ys):
+            h = (h ^ (np.asarray(value, dtype=np.int64) & 0xFFFFFFFF).astype(np.uint32)) * np.uint32(0x01000193)
+        h ^= h >> 16
+        h *= np.uint32(0x85EBCA6B)
+        h ^= h >> 13
+        h *= np.uint32(0xC2B2AE35)
+        h ^= h >> 16
+        return h / 2**32
     
 """ @staticmethod # REMOVED (for now)
     def draw_pond(node_map: list[list[int]], min_radius: int = 1, max_radius: int = 2):
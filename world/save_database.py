@@ -0,0 +1,138 @@
+from __future__ import annotations
+import os
+import sqlite3
+from typing import TYPE_CHECKING
+
+# Runtime Imports
+from core.database import DatabaseManager
+from core.debug_logger import Log
+from world.chunk import ChunkRecord
+from world.save_file import SaveGame, PlantRecord, InventorySlot
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    from world.save_file import SaveDelta
+    from world.chunk import ChunkKey
+
+class SaveDatabase(DatabaseManager):
+    """ The same data as a binary save (see world.save_file), kept in an SQLite database instead,
+    so saves can be queried. Writes are batched upserts in one transaction (WAL mode keeps them cheap),
+    and load() rebuilds a SaveGame with a single query per table. """
+
+    TABLES = {
+        "player": [
+            "id INTEGER PRIMARY KEY CHECK (id = 0)", "seed INTEGER NOT NULL", "chunk_size INTEGER NOT NULL",
+            "player_x INTEGER", "player_y INTEGER", "money INTEGER DEFAULT 0", "character TEXT NOT NULL",
+            "growth_time REAL DEFAULT 0", "saved_at REAL DEFAULT 0",
+            "clock_minutes REAL DEFAULT 0"
+        ],
+        "chunks": [ # Only the chunks that differ from the generated world, as in the binary save
+            "chunk_x INTEGER", "chunk_y INTEGER", "nodes BLOB", "flags BLOB",
+            "PRIMARY KEY (chunk_x, chunk_y)"
+        ],
+        "plants": [
+            "grid_x INTEGER", "grid_y INTEGER", "plant_id TEXT NOT NULL",
+            "age REAL DEFAULT 0", "is_harvested BOOLEAN DEFAULT 0", "synced_at REAL DEFAULT 0",
+            "PRIMARY KEY (grid_x, grid_y)"
+        ],
+        "inventory": [
+            "slot INTEGER PRIMARY KEY", "item_id TEXT NOT NULL", "count INTEGER DEFAULT 1", "water_level INTEGER"
+        ]
+    }
+
+    VIEWS = {
+        "view_crops": "SELECT plant_id, COUNT(*) AS planted, SUM(is_harvested) AS harvested FROM plants GROUP BY plant_id"
+    }
+
+    PLANT_COLUMNS = ("grid_x", "grid_y", "plant_id", "age", "is_harvested", "synced_at")
+    SLOT_COLUMNS = ("slot", "item_id", "count", "water_level")
+
+    # A chunk record may hold only its nodes or only its flags, so keep whichever part is missing
+    UPSERT_CHUNK = ("INSERT INTO chunks (chunk_x, chunk_y, nodes, flags) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (chunk_x, chunk_y) DO UPDATE SET "
+                    "nodes = COALESCE(excluded.nodes, nodes), flags = COALESCE(excluded.flags, flags)")
+
+    def __init__(self, db_path: str) -> None:
+        super().__init__(db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.execute("PRAGMA synchronous = NORMAL;") # WAL stays consistent after a crash with this
+        self.setup_tables()
+
+    def save(self, save: SaveGame) -> None:
+        """Replaces everything in the database with a full save."""
+        with self.conn: # One transaction
+            for table in ("chunks", "plants", "inventory"):
+                self.cursor.execute(f"DELETE FROM {table}")
+            self.insert_record("player", {
+                "id": 0, "seed": save.seed, "chunk_size": save.chunk_size, "player_x": save.player_pos[0],
+                "player_y": save.player_pos[1], "money": save.money, "character": save.character,
+                "growth_time": save.growth_time, "saved_at": save.saved_at,
+                "clock_minutes": save.clock_minutes
+            })
+            self.cursor.executemany(self.UPSERT_CHUNK, self._chunk_rows(save.chunks))
+            self.insert_records("plants", self.PLANT_COLUMNS, self._plant_rows(save.plants))
+            self.insert_records("inventory", self.SLOT_COLUMNS, save.inventory)
+
+    def apply(self, delta: SaveDelta) -> None:
+        """Upserts an autosave's changes on top of what is already saved."""
+        with self.conn:
+            if delta.player is not None:
+                player_x, player_y, money = delta.player
+                self.cursor.execute("UPDATE player SET player_x = ?, player_y = ?, money = ? WHERE id = 0",
+                                    (player_x, player_y, money))
+            if delta.growth_time is not None:
+                self.cursor.execute("UPDATE player SET growth_time = ? WHERE id = 0", (delta.growth_time,))
+            if delta.saved_at is not None:
+                self.cursor.execute("UPDATE player SET saved_at = ? WHERE id = 0", (delta.saved_at,))
+            if delta.clock_minutes is not None:
+                self.cursor.execute("UPDATE player SET clock_minutes = ? WHERE id = 0", (delta.clock_minutes,))
+            self.cursor.executemany(self.UPSERT_CHUNK, self._chunk_rows(delta.chunks))
+            self.insert_records("plants", self.PLANT_COLUMNS, self._plant_rows(delta.plants))
+            if delta.inventory is not None: # Always the whole inventory
+                self.cursor.execute("DELETE FROM inventory")
+                self.insert_records("inventory", self.SLOT_COLUMNS, delta.inventory)
+
+    def load(self) -> SaveGame | None:
+        if not (row := self.cursor.execute("SELECT * FROM player WHERE id = 0").fetchone()):
+            return None
+        save = SaveGame(row["seed"], row["chunk_size"], (row["player_x"], row["player_y"]), row["character"], row["money"],
+                        growth_time=row["growth_time"], saved_at=row["saved_at"],
+                        clock_minutes=row["clock_minutes"])
+
+        save.chunks = {(chunk_x, chunk_y): ChunkRecord(nodes, flags) for chunk_x, chunk_y, nodes, flags
+                       in self.cursor.execute("SELECT chunk_x, chunk_y, nodes, flags FROM chunks")}
+        save.plants = [PlantRecord(plant_id, grid_x, grid_y, age, bool(is_harvested), synced_at)
+                       for grid_x, grid_y, plant_id, age, is_harvested, synced_at
+                       in self.cursor.execute("SELECT grid_x, grid_y, plant_id, age, is_harvested, synced_at FROM plants")]
+        save.inventory = [InventorySlot(*row) for row
+                          in self.cursor.execute("SELECT slot, item_id, count, water_level FROM inventory ORDER BY slot")]
+        return save
+
+    # --- PRIVATE HELPERS ---
+
+    @staticmethod
+    def _chunk_rows(chunks: dict[ChunkKey, ChunkRecord]) -> list[tuple]:
+        return [(chunk_x, chunk_y, None if record.nodes is None else bytes(record.nodes),
+                 None if record.flags is None else bytes(record.flags)) for (chunk_x, chunk_y), record in chunks.items()]
+
+    @staticmethod
+    def _plant_rows(plants: list[PlantRecord]) -> list[tuple]:
+        return [(plant.grid_x, plant.grid_y, plant.plant_id, plant.age, plant.is_harvested, plant.synced_at) for plant in plants]
+
+def read_save_database(path: str) -> SaveGame | None:
+    """Loads a save from an SQLite save database, or None if there isn't a usable one."""
+    if not os.path.exists(path):
+        return None
+    try:
+        database = SaveDatabase(path)
+        try:
+            save = database.load()
+        finally:
+            database.close()
+    except sqlite3.Error as error:
+        Log.error(f"Save database '{path}' is unreadable: {error}")
+        return None
+
+    if save:
+        Log.info(f"Loaded save database '{path}' ({len(save.chunks)} chunks, {len(save.plants)} plants).")
+    return save
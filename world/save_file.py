@@ -0,0 +1,339 @@
+""" Binary save format (all little-endian):
+    HEADER        magic, version, generation, chunk size, seed, player position, money, growth clock, save time, game time, character, counts
+    CHUNK INDEX   one entry per saved chunk: key, which parts are present, and where its data starts
+    CHUNK DATA    per chunk: (2 * size)^2 uint8 nodes, then size^2 uint8 tile flags (each only if present)
+    PLANTS        one fixed-size record per plant, followed by its UTF-8 id
+    INVENTORY     one fixed-size record per filled slot, followed by its UTF-8 item id
+Only chunks that differ from the generated world are stored, since everything else rebuilds from the seed.
+
+Autosaves append SaveDelta records to a journal next to the save (see append_journal).
+A journal only applies to the save generation written in its header, and is replayed on top of it by read_save. """
+from __future__ import annotations
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+# Runtime Imports
+from core.debug_logger import Log
+from world.chunk import ChunkRecord, ChunkKey
+
+MAGIC = b"PPSV"
+JOURNAL_MAGIC = b"PPJL"
+VERSION = 5
+
+HEADER = struct.Struct("<4sHIHQiiiddd16sIII") # magic, version, generation, chunk_size, seed, player_x, player_y, money, growth_time, saved_at, clock_minutes, character, chunks, plants, slots
+CHUNK_ENTRY = struct.Struct("<iiBQ")       # chunk_x, chunk_y, parts, data offset
+PLANT_ENTRY = struct.Struct("<iifd?B")     # grid_x, grid_y, age, synced_at, is_harvested, id length
+SLOT_ENTRY = struct.Struct("<BHhB")        # slot index, count, water level (-1 = none), id length
+
+JOURNAL_HEADER = struct.Struct("<4sHIQ")   # magic, version, generation, seed
+RECORD_HEADER = struct.Struct("<IBI")      # payload length, record type, crc32 of the payload
+JOURNAL_CHUNK = struct.Struct("<iiB")      # chunk_x, chunk_y, parts (then the parts, as in the save)
+JOURNAL_PLAYER = struct.Struct("<iii")     # player_x, player_y, money
+JOURNAL_INVENTORY = struct.Struct("<B")    # slot count (then one SLOT_ENTRY each)
+JOURNAL_GROWTH = struct.Struct("<d")       # growth_time
+JOURNAL_TIME = struct.Struct("<d")         # saved_at
+JOURNAL_CLOCK = struct.Struct("<d")        # clock_minutes
+
+HAS_NODES = 1
+HAS_FLAGS = 2
+
+# Journal record types
+CHUNK_RECORD, PLANT_RECORD, PLAYER_RECORD, INVENTORY_RECORD, GROWTH_RECORD, TIME_RECORD, CLOCK_RECORD = 1, 2, 3, 4, 5, 6, 7
+
+class PlantRecord(NamedTuple):
+    plant_id: str
+    grid_x: int
+    grid_y: int
+    age: float
+    is_harvested: bool
+    synced_at: float = 0.0 # The growth clock when the age was read (the plant has aged since, see PlantGroup)
+
+class InventorySlot(NamedTuple):
+    index: int
+    item_id: str
+    count: int
+    water_level: int | None
+
+@dataclass
+class SaveDelta:
+    """What changed since the last autosave. Every record holds the full new state of that thing,
+        so replaying a record twice is harmless."""
+    chunks: dict[ChunkKey, ChunkRecord] = field(default_factory=dict)
+    plants: list[PlantRecord] = field(default_factory=list)
+    player: tuple[int, int, int] | None = None       # player_x, player_y, money
+    inventory: list[InventorySlot] | None = None      # Every filled slot
+    growth_time: float | None = None                  # The plant growth clock
+    saved_at: float | None = None                     # Real (Unix) time of the autosave
+    clock_minutes: float | None = None                # In-game time (see GameClock)
+
+    def __bool__(self) -> bool:
+        return (bool(self.chunks or self.plants) or self.player is not None or self.inventory is not None
+                or self.growth_time is not None or self.saved_at is not None or self.clock_minutes is not None)
+
+@dataclass
+class SaveGame:
+    """Everything needed to rebuild a session on top of the seeded world."""
+    seed: int
+    chunk_size: int
+    player_pos: tuple[int, int]
+    character: str
+    money: int = 0
+    chunks: dict[ChunkKey, ChunkRecord] = field(default_factory=dict)
+    plants: list[PlantRecord] = field(default_factory=list)
+    inventory: list[InventorySlot] = field(default_factory=list)
+    generation: int = 0 # Bumped by every full save, so stale journals are ignored
+    growth_time: float = 0.0 # The plant growth clock (see PlantGroup.growth_time)
+    saved_at: float = 0.0    # Real (Unix) time of the last save or autosave (0 = unknown), for offline growth
+    clock_minutes: float = 0.0 # In-game time (see GameClock.minutes)
+
+    def apply(self, delta: SaveDelta) -> None:
+        """Replays an autosave journal record on top of the save."""
+        for key, record in delta.chunks.items():
+            saved = self.chunks.setdefault(key, ChunkRecord())
+            saved.nodes = record.nodes if record.nodes is not None else saved.nodes
+            saved.flags = record.flags if record.flags is not None else saved.flags
+        if delta.plants:
+            plants = {(plant.grid_x, plant.grid_y): plant for plant in self.plants}
+            plants.update({(plant.grid_x, plant.grid_y): plant for plant in delta.plants})
+            self.plants = list(plants.values())
+        if delta.player is not None:
+            player_x, player_y, self.money = delta.player
+            self.player_pos = (player_x, player_y)
+        if delta.inventory is not None:
+            self.inventory = delta.inventory
+        if delta.growth_time is not None:
+            self.growth_time = delta.growth_time
+        if delta.saved_at is not None:
+            self.saved_at = delta.saved_at
+        if delta.clock_minutes is not None:
+            self.clock_minutes = delta.clock_minutes
+
+def journal_path(path: str) -> str:
+    return path + ".journal"
+
+def _pack_chunk_parts(record: ChunkRecord) -> tuple[int, list[bytes | memoryview]]:
+    parts = (HAS_NODES if record.nodes is not None else 0) | (HAS_FLAGS if record.flags is not None else 0)
+    return parts, [data for data in (record.nodes, record.flags) if data is not None]
+
+def _pack_plant(plant: PlantRecord) -> bytes:
+    plant_id = plant.plant_id.encode("utf-8")
+    return PLANT_ENTRY.pack(plant.grid_x, plant.grid_y, plant.age, plant.synced_at, plant.is_harvested, len(plant_id)) + plant_id
+
+def _unpack_plant(view: memoryview, position: int) -> tuple[PlantRecord, int]:
+    grid_x, grid_y, age, synced_at, is_harvested, id_length = PLANT_ENTRY.unpack_from(view, position)
+    position += PLANT_ENTRY.size
+    plant_id = bytes(view[position:position + id_length]).decode("utf-8")
+    return PlantRecord(plant_id, grid_x, grid_y, age, is_harvested, synced_at), position + id_length
+
+def _pack_slot(slot: InventorySlot) -> bytes:
+    item_id = slot.item_id.encode("utf-8")
+    water_level = -1 if slot.water_level is None else slot.water_level
+    return SLOT_ENTRY.pack(slot.index, slot.count, water_level, len(item_id)) + item_id
+
+def _unpack_slot(view: memoryview, position: int) -> tuple[InventorySlot, int]:
+    index, count, water_level, id_length = SLOT_ENTRY.unpack_from(view, position)
+    position += SLOT_ENTRY.size
+    item_id = bytes(view[position:position + id_length]).decode("utf-8")
+    return InventorySlot(index, item_id, count, None if water_level < 0 else water_level), position + id_length
+
+def write_save(path: str, save: SaveGame) -> None:
+    """Writes the save to a temporary file next to the target, then swaps it in with os.replace,
+        so a crash mid-write can never leave a half-written save behind."""
+    node_size, flag_size = (2 * save.chunk_size) ** 2, save.chunk_size ** 2
+
+    # --- 1. Work out where each chunk's data will sit ---
+    index, offset = [], HEADER.size + CHUNK_ENTRY.size * len(save.chunks)
+    for (chunk_x, chunk_y), record in save.chunks.items():
+        parts, _ = _pack_chunk_parts(record)
+        index.append(CHUNK_ENTRY.pack(chunk_x, chunk_y, parts, offset))
+        offset += node_size * bool(parts & HAS_NODES) + flag_size * bool(parts & HAS_FLAGS)
+
+    # --- 2. Write everything in one go ---
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            player_x, player_y = save.player_pos
+            file.write(HEADER.pack(MAGIC, VERSION, save.generation, save.chunk_size, save.seed & 0xFFFFFFFFFFFFFFFF, 
+                                   player_x, player_y, save.money, save.growth_time, save.saved_at, save.clock_minutes,
+                                   save.character.encode("utf-8"), len(save.chunks), len(save.plants), len(save.inventory)))
+            file.writelines(index)
+            for record in save.chunks.values():
+                file.writelines(_pack_chunk_parts(record)[1])
+            file.writelines(_pack_plant(plant) for plant in save.plants)
+            file.writelines(_pack_slot(slot) for slot in save.inventory)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    # The journal belonged to the previous generation, and everything in it is now in the save
+    if os.path.exists(journal_path(path)):
+        os.remove(journal_path(path))
+
+    Log.success(f"Saved {len(save.chunks)} chunks and {len(save.plants)} plants to '{path}'.")
+
+def read_save(path: str) -> SaveGame | None:
+    """Memory-maps a save file, so nothing is parsed that doesn't need to be. Chunk data is copied out
+        (one memcpy per chunk) and the map is closed before returning, so the next full save can replace the file.
+        Returns None if there is no usable save."""
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # Empty file
+            Log.error(f"Save file '{path}' is empty.")
+            return None
+    view = memoryview(data)
+
+    try:
+        (magic, version, generation, chunk_size, seed, player_x, player_y,
+         money, growth_time, saved_at, clock_minutes, character, chunk_count, plant_count, slot_count) = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            Log.error(f"'{path}' is not a version {VERSION} save file.")
+            return None
+
+        save = SaveGame(seed, chunk_size, (player_x, player_y), character.rstrip(b"\0").decode("utf-8"), money,
+                        generation=generation, growth_time=growth_time, saved_at=saved_at, clock_minutes=clock_minutes)
+        node_size, flag_size = (2 * chunk_size) ** 2, chunk_size ** 2
+
+        # --- 1. Chunks (copied straight out of the map) ---
+        end = HEADER.size + CHUNK_ENTRY.size * chunk_count
+        for chunk_x, chunk_y, parts, offset in CHUNK_ENTRY.iter_unpack(view[HEADER.size:HEADER.size + CHUNK_ENTRY.size * chunk_count]):
+            record = ChunkRecord()
+            if parts & HAS_NODES:
+                record.nodes, offset = bytes(view[offset:offset + node_size]), offset + node_size
+            if parts & HAS_FLAGS:
+                record.flags, offset = bytes(view[offset:offset + flag_size]), offset + flag_size
+            save.chunks[(chunk_x, chunk_y)] = record
+            end = max(end, offset)
+        if end > len(view):
+            raise struct.error("chunk data runs past the end of the file")
+
+        # --- 2. Plants and inventory (after the last chunk) ---
+        position = end
+        for _ in range(plant_count):
+            plant, position = _unpack_plant(view, position)
+            save.plants.append(plant)
+        for _ in range(slot_count):
+            slot, position = _unpack_slot(view, position)
+            save.inventory.append(slot)
+    except (struct.error, UnicodeDecodeError) as error:
+        Log.error(f"Save file '{path}' is corrupt: {error}")
+        return None
+    finally: # Nothing may keep the file mapped (Windows can't replace a mapped file)
+        view.release()
+        data.close()
+
+    # --- 3. Replay the autosave journal on top ---
+    replayed = 0
+    for delta in read_journal(journal_path(path), save.generation, save.chunk_size):
+        save.apply(delta)
+        replayed += 1
+
+    Log.info(f"Loaded save '{path}' ({len(save.chunks)} chunks, {len(save.plants)} plants, {replayed} journal records).")
+    return save
+
+def append_journal(path: str, generation: int, seed: int, delta: SaveDelta) -> int:
+    """Appends one autosave to the journal (starting a new journal if needed) and fsyncs it.
+        Each record is length-prefixed and checksummed, so a torn write at the end is simply ignored.
+        Returns the number of bytes written."""
+    records: list[bytes] = []
+    def add(record_type: int, *payload: bytes | memoryview) -> None:
+        data = b"".join(payload)
+        records.append(RECORD_HEADER.pack(len(data), record_type, zlib.crc32(data)) + data)
+
+    for (chunk_x, chunk_y), record in delta.chunks.items():
+        parts, data = _pack_chunk_parts(record)
+        add(CHUNK_RECORD, JOURNAL_CHUNK.pack(chunk_x, chunk_y, parts), *data)
+    for plant in delta.plants:
+        add(PLANT_RECORD, _pack_plant(plant))
+    if delta.player is not None:
+        add(PLAYER_RECORD, JOURNAL_PLAYER.pack(*delta.player))
+    if delta.inventory is not None:
+        add(INVENTORY_RECORD, JOURNAL_INVENTORY.pack(len(delta.inventory)), *map(_pack_slot, delta.inventory))
+    if delta.growth_time is not None:
+        add(GROWTH_RECORD, JOURNAL_GROWTH.pack(delta.growth_time))
+    if delta.saved_at is not None:
+        add(TIME_RECORD, JOURNAL_TIME.pack(delta.saved_at))
+    if delta.clock_minutes is not None:
+        add(CLOCK_RECORD, JOURNAL_CLOCK.pack(delta.clock_minutes))
+
+    # A journal from an older generation is stale, so start again
+    path = journal_path(path)
+    header = JOURNAL_HEADER.pack(JOURNAL_MAGIC, VERSION, generation, seed & 0xFFFFFFFFFFFFFFFF)
+    fresh = not os.path.exists(path) or _journal_header(path) != header
+    with open(path, "wb" if fresh else "ab") as file:
+        if fresh:
+            file.write(header)
+        file.writelines(records)
+        file.flush()
+        os.fsync(file.fileno())
+    return sum(map(len, records))
+
+def _journal_header(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read(JOURNAL_HEADER.size)
+
+def read_journal(path: str, generation: int, chunk_size: int) -> list[SaveDelta]:
+    """Reads back every complete record in a journal for this save generation (one SaveDelta each)."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as file:
+        view = memoryview(file.read())
+
+    try:
+        magic, version, journal_generation, _ = JOURNAL_HEADER.unpack_from(view)
+    except struct.error:
+        return []
+    if magic != JOURNAL_MAGIC or version != VERSION or journal_generation != generation:
+        Log.info(f"Ignoring stale autosave journal '{path}'.")
+        return []
+
+    node_size, flag_size = (2 * chunk_size) ** 2, chunk_size ** 2
+    deltas, position = [], JOURNAL_HEADER.size
+    while position + RECORD_HEADER.size <= len(view):
+        length, record_type, checksum = RECORD_HEADER.unpack_from(view, position)
+        payload = view[position + RECORD_HEADER.size:position + RECORD_HEADER.size + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            Log.error(f"Autosave journal '{path}' ends with a torn record, ignoring it.")
+            break
+        position += RECORD_HEADER.size + length
+
+        delta = SaveDelta()
+        if record_type == CHUNK_RECORD:
+            chunk_x, chunk_y, parts = JOURNAL_CHUNK.unpack_from(payload)
+            offset, record = JOURNAL_CHUNK.size, ChunkRecord()
+            if parts & HAS_NODES:
+                record.nodes, offset = bytes(payload[offset:offset + node_size]), offset + node_size
+            if parts & HAS_FLAGS:
+                record.flags = bytes(payload[offset:offset + flag_size])
+            delta.chunks[(chunk_x, chunk_y)] = record
+        elif record_type == PLANT_RECORD:
+            delta.plants.append(_unpack_plant(payload, 0)[0])
+        elif record_type == PLAYER_RECORD:
+            delta.player = JOURNAL_PLAYER.unpack_from(payload)
+        elif record_type == INVENTORY_RECORD:
+            (slot_count,), offset, slots = JOURNAL_INVENTORY.unpack_from(payload), JOURNAL_INVENTORY.size, []
+            for _ in range(slot_count):
+                slot, offset = _unpack_slot(payload, offset)
+                slots.append(slot)
+            delta.inventory = slots
+        elif record_type == GROWTH_RECORD:
+            (delta.growth_time,) = JOURNAL_GROWTH.unpack_from(payload)
+        elif record_type == TIME_RECORD:
+            (delta.saved_at,) = JOURNAL_TIME.unpack_from(payload)
+        elif record_type == CLOCK_RECORD:
+            (delta.clock_minutes,) = JOURNAL_CLOCK.unpack_from(payload)
+        deltas.append(delta)
+    return deltas
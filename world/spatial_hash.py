@@ -0,0 +1,65 @@
+from __future__ import annotations
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable
+
+# Runtime Imports
+from settings import BLOCK_SIZE
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    import pygame
+    from entities.entity import Entity
+
+Cell = tuple[int, int]
+
+class SpatialHash:
+    """ A uniform grid of BLOCK_SIZE cells, each listing the bodies whose bounds (the hitbox by default) overlap it.
+    Bodies are re-bucketed only when they move or resize (update), so a query just
+    visits the few cells under the rect it is given, however many bodies there are. """
+    def __init__(self, cell_size: int = BLOCK_SIZE, 
+                 bounds: Callable[[Entity], pygame.Rect] = attrgetter("hitbox")) -> None:
+        self.cell_size = cell_size
+        self.bounds = bounds
+        self.cells: dict[Cell, list[Entity]] = {}
+        self.body_cells: dict[Entity, tuple[Cell, ...]] = {} # The cells each body is listed in
+
+    def __len__(self) -> int:
+        return len(self.body_cells)
+
+    def __contains__(self, body: Entity) -> bool:
+        return body in self.body_cells
+
+    def cells_for(self, rect: pygame.Rect) -> tuple[Cell, ...]:
+        size = self.cell_size
+        return tuple((cell_x, cell_y)
+                     for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1)
+                     for cell_x in range(rect.left // size, (rect.right - 1) // size + 1))
+
+    def insert(self, body: Entity) -> None:
+        cells = self.cells_for(self.bounds(body))
+        self.body_cells[body] = cells
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(body)
+
+    def remove(self, body: Entity) -> None:
+        for cell in self.body_cells.pop(body, ()):
+            bucket = self.cells[cell]
+            bucket.remove(body)
+            if not bucket:
+                del self.cells[cell]
+
+    def update(self, body: Entity) -> None:
+        """Re-buckets a body after it has moved or changed size (inserting it if needed)."""
+        if self.body_cells.get(body) != self.cells_for(self.bounds(body)):
+            self.remove(body)
+            self.insert(body)
+
+    def query(self, rect: pygame.Rect) -> list[Entity]:
+        """Every body whose bounds overlap the rect (each listed once)."""
+        found: dict[Entity, None] = {} # Keeps insertion order, unlike a set
+        cells, bounds = self.cells, self.bounds
+        for cell in self.cells_for(rect):
+            for body in cells.get(cell, ()):
+                if body not in found and rect.colliderect(bounds(body)):
+                    found[body] = None
+        return list(found)
@@ -3,122 +3,327 @@ import pygame
 from typing import TYPE_CHECKING
 
 # Runtime Imports
-from settings import BLOCK_SIZE
+from settings import BLOCK_SIZE, CHUNK_SIZE
 from core.assets import ASSETS
-from core.assets.asset_data import LAYOUT
+from core.assets.asset_data import LAYOUT, QUAD_MASKS
+from world.tile_store import TileStore
 
 # Type-Only Imports
 if TYPE_CHECKING:
-    from custom_types import Group, Num
     from world.level import Level
     from entities.entity import Entity
-    from entities.player import Player
 
-class MapTileGroup(pygame.sprite.Group):
+class TileSurfacePool:
+    """Refcounted flyweight pool of tile surfaces.
+        Tiles that look the same (same Tile.visual_key) share one surface, which is rendered once
+        and must be treated as read-only. Each baked chunk holds a reference to the surfaces it
+        used, so a surface is freed as soon as no chunk needs it any more."""
     def __init__(self) -> None:
-        super().__init__()
-        self.display_surface = pygame.display.get_surface()
+        self.surfaces: dict[tuple, pygame.Surface] = {}
+        self.refcounts: dict[tuple, int] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def acquire(self, key: tuple, tile: Tile) -> pygame.Surface:
+        """Returns the shared surface for a visual key, rendering the tile on first use."""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = self.surfaces[key] = tile.render()
+            self.refcounts[key] = 0
+        else:
+            self.hits += 1
+        self.refcounts[key] += 1
+        return surface
+
+    def release(self, key: tuple) -> None:
+        """Drops one reference, freeing the surface once nothing uses it."""
+        count = self.refcounts.get(key, 0) - 1
+        if count > 0:
+            self.refcounts[key] = count
+        else:
+            self.refcounts.pop(key, None)
+            self.surfaces.pop(key, None)
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+        self.refcounts.clear()
+
 
-    def custom_draw(self, camera_offset: pygame.math.Vector2) -> None:
-        """Draws all tiles, applying the camera offset and snapping to integers 
-        to prevent sprite tearing."""
-        for tile in self.sprites():
-            # Apply the offset and cast to int to prevent sub-pixel gaps
-            offset_x = int(tile.rect.left - camera_offset.x)
-            offset_y = int(tile.rect.top - camera_offset.y)
-            
-            self.display_surface.blit(tile.image, (offset_x, offset_y))
-
-
-class Tile(pygame.sprite.Sprite):
-    """The Base Class. Holds the factory method and basic visual/position data."""
-    def __init__(self, level: Level, x: Num, y: Num, tile_type_key: str, neighbors: list[bool], 
-                 group: Group, detail_image: pygame.Surface | None = None) -> None:
-        super().__init__(group)
+class TerrainRenderer:
+    """Draws the level's tiles as pre-baked chunks of CHUNK_SIZE x CHUNK_SIZE tiles.
+        A chunk is only re-baked when one of its tiles changes (tilling, watering, etc),
+        and only once it scrolls into view."""
+    def __init__(self, level: Level, chunk_size: int = CHUNK_SIZE) -> None:
         self.level = level
-        self.grid_x = int(x // BLOCK_SIZE)
-        self.grid_y = int(y // BLOCK_SIZE)
-        self.position = (x, y)
-        self.tile_type_key = tile_type_key
-        self.detail_image = detail_image
-        
-        self.occupant: Entity|None = None 
-        
-        # Unified Tile Attributes
-        self._base_obstructed = False
-        self.tillable: bool = False
-        self.is_tilled: bool = False
-        self.watered: bool = False
+        self.display_surface = pygame.display.get_surface()
+        self.chunk_size = chunk_size
+
+        self.chunk_surfaces: dict[tuple[int, int], pygame.Surface] = {}
+        self.chunk_rects: dict[tuple[int, int], pygame.Rect] = {}
+        self.dirty_chunks: set[tuple[int, int]] = set()
+
+        # Shared tile surfaces, plus the visual keys each chunk holds a reference to
+        self.surface_pool = TileSurfacePool()
+        self.chunk_visuals: dict[tuple[int, int], list[tuple]] = {}
+
+        # Culling stats from the last draw (shown in the debug overlay)
+        self.drawn_count: int = 0
+        self.culled_count: int = 0
+
+    def reset(self) -> None:
+        """Throws away every baked chunk (e.g. after the level is regenerated)."""
+        self.chunk_surfaces.clear()
+        self.chunk_rects.clear()
+        self.dirty_chunks.clear()
+        self.chunk_visuals.clear()
+        self.surface_pool.clear()
+
+    def mark_dirty(self, grid_x: int, grid_y: int) -> None:
+        """Flags the chunk containing this tile to be re-baked before it is next drawn."""
+        self.dirty_chunks.add((grid_x // self.chunk_size, grid_y // self.chunk_size))
 
-        # Generate initial visual
-        self.image = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
-        self.refresh_terrain(neighbors)
-        self.rect = self.image.get_rect(topleft=self.position)
+    def drop_chunk(self, key: tuple[int, int]) -> None:
+        """Frees a chunk's baked surface and its pooled tile surfaces (e.g. when it is evicted)."""
+        self.chunk_surfaces.pop(key, None)
+        self.chunk_rects.pop(key, None)
+        self.dirty_chunks.discard(key)
+        for visual_key in self.chunk_visuals.pop(key, ()):
+            self.surface_pool.release(visual_key)
+
+    def bake_chunk(self, key: tuple[int, int]) -> None:
+        """Composes every tile in the chunk into one surface."""
+        chunk = self.level.chunks.get(key)
+        if chunk is None:
+            return
+
+        cols, rows = chunk.grid_range
+        bounds = pygame.Rect(cols.start * BLOCK_SIZE, rows.start * BLOCK_SIZE,
+                             len(cols) * BLOCK_SIZE, len(rows) * BLOCK_SIZE)
+        surface = pygame.Surface(bounds.size)
+
+        # Let go of the surfaces from the last bake before taking new references
+        for visual_key in self.chunk_visuals.pop(key, ()):
+            self.surface_pool.release(visual_key)
+
+        visuals: list[tuple] = []
+        for grid_y in rows:
+            for grid_x in cols:
+                tile = chunk.tile(self.level, grid_x, grid_y)
+                visual_key = tile.visual_key
+                tile_surface = self.surface_pool.acquire(visual_key, tile)
+                visuals.append(visual_key)
+                surface.blit(tile_surface, (grid_x * BLOCK_SIZE - bounds.left, grid_y * BLOCK_SIZE - bounds.top))
+
+        self.chunk_visuals[key] = visuals
+        self.chunk_surfaces[key] = surface
+        self.chunk_rects[key] = bounds
+
+    def visible_chunks(self, view_rect: pygame.Rect) -> list[tuple[int, int]]:
+        """Converts the camera rect straight into a range of chunk coordinates,
+            rather than testing every chunk against the camera. Only loaded chunks are returned."""
+        chunk_pixels = self.chunk_size * BLOCK_SIZE
+        first_x, last_x = view_rect.left // chunk_pixels, (view_rect.right - 1) // chunk_pixels
+        first_y, last_y = view_rect.top // chunk_pixels, (view_rect.bottom - 1) // chunk_pixels
+
+        loaded = self.level.chunks
+        return [(cx, cy) for cy in range(first_y, last_y + 1) for cx in range(first_x, last_x + 1)
+                if (cx, cy) in loaded]
+
+    def custom_draw(self, view_rect: pygame.Rect) -> None:
+        """Bakes any dirty or missing chunks, then draws only the chunks inside the camera view."""
+        self.drawn_count = 0
+
+        for key in self.visible_chunks(view_rect):
+            if key in self.dirty_chunks or key not in self.chunk_surfaces:
+                self.bake_chunk(key)
+                self.dirty_chunks.discard(key)
+
+            # Shift into screen space (view_rect is already snapped to integers)
+            chunk_rect = self.chunk_rects[key]
+            self.display_surface.blit(self.chunk_surfaces[key], chunk_rect.move(-view_rect.left, -view_rect.top))
+            self.drawn_count += (chunk_rect.width // BLOCK_SIZE) * (chunk_rect.height // BLOCK_SIZE)
+
+        self.culled_count = len(self.level.chunks) * self.chunk_size ** 2 - self.drawn_count
+
+
+class Tile:
+    """ The Base Class: a lightweight view onto one cell of a chunk's TileStore.
+    Views hold no state of their own, so they are created on demand (Level.get_tile)
+    and can be thrown away freely. Two views of the same cell compare equal. """
+    __slots__ = ("level", "store", "grid_x", "grid_y", "index")
+
+    def __init__(self, level: Level, store: TileStore, grid_x: int, grid_y: int, index: int) -> None:
+        self.level = level
+        self.store = store
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+        self.index = index
 
     @classmethod
-    def create(cls, level: Level, x: Num, y: Num, tile_type_key: str, neighbors: list[bool], 
-               group: Group, detail_image: pygame.Surface | None = None) -> Tile:
-        """THE FACTORY: Looks at the key and returns the correct subclass!"""
-        if tile_type_key == "WATER":
-            return WaterTile(level, x, y, tile_type_key, neighbors, group, detail_image)
+    def create(cls, level: Level, store: TileStore, grid_x: int, grid_y: int, index: int) -> Tile:
+        """THE FACTORY: Looks at the stored type and returns a view of the correct subclass!"""
+        if store.types[index] == TileStore.TYPE_IDS["WATER"]:
+            return WaterTile(level, store, grid_x, grid_y, index)
         else:
-            return GroundTile(level, x, y, tile_type_key, neighbors, group, detail_image)
-
-    def refresh_terrain(self, new_neighbors: list[bool]) -> None:
-        """Generates the base visual. Subclasses will extend this."""
-        pass
-    
-# Subclasses 
-    
+            return GroundTile(level, store, grid_x, grid_y, index)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Tile) and other.store is self.store and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.index))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.grid_x}, {self.grid_y}, {self.tile_type_key})"
+
+    # --- POSITION ---
+    @property
+    def position(self) -> tuple[int, int]:
+        return (self.grid_x * BLOCK_SIZE, self.grid_y * BLOCK_SIZE)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(self.grid_x * BLOCK_SIZE, self.grid_y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
+
+    # --- STORED STATE ---
+    @property
+    def tile_type_key(self) -> str:
+        return TileStore.TYPE_KEYS[self.store.types[self.index]]
+
+    @property
+    def mask(self) -> int:
+        return self.store.masks[self.index]
+
+    @property
+    def detail_image(self) -> pygame.Surface | None:
+        detail = self.store.details[self.index]
+        if not detail:
+            return None
+        detail_key = "DETAIL_DIRT" if self.tile_type_key == "DIRT" else "DETAIL_GRASS"
+        detail_list = ASSETS.tiles.storage.get(detail_key) or []
+        return detail_list[detail - 1] if detail <= len(detail_list) else None
+
+    @property
+    def tillable(self) -> bool:
+        return self.store.has_flag(self.index, TileStore.TILLABLE)
+
+    @property
+    def _base_obstructed(self) -> bool:
+        return self.store.has_flag(self.index, TileStore.OBSTRUCTED)
+
+    @property
+    def is_tilled(self) -> bool:
+        return self.store.has_flag(self.index, TileStore.TILLED)
+
+    @is_tilled.setter
+    def is_tilled(self, value: bool) -> None:
+        self._set_visual_flag(TileStore.TILLED, value)
+
+    @property
+    def watered(self) -> bool:
+        return self.store.has_flag(self.index, TileStore.WATERED)
+
+    @watered.setter
+    def watered(self, value: bool) -> None:
+        """Wet soil is drawn darker, so redraw whenever this flips."""
+        self._set_visual_flag(TileStore.WATERED, value)
+
+    @property
+    def occupant(self) -> Entity | None:
+        return self.store.get_occupant(self.index)
+
+    @occupant.setter
+    def occupant(self, entity: Entity | None) -> None:
+        self.store.set_occupant(self.index, entity)
+
+    def _set_visual_flag(self, flag: int, value: bool) -> None:
+        if self.store.has_flag(self.index, flag) != value:
+            self.store.set_flag(self.index, flag, value)
+            self.level.mark_tile_changed(self.grid_x, self.grid_y)
+
+    # --- VISUALS ---
+    def refresh_terrain(self, new_mask: int) -> None:
+        """Stores the new 9-bit grass mask and flags the tile to be redrawn."""
+        self.store.masks[self.index] = new_mask
+        # The level's renderer bakes tiles into chunks, so let it know this one changed
+        self.level.renderer.mark_dirty(self.grid_x, self.grid_y)
+
+    @property
+    def visual_key(self) -> tuple:
+        """Everything that changes how the tile looks. Equal keys share one pooled surface."""
+        return (self.tile_type_key,)
+
+    def render(self) -> pygame.Surface:
+        """Generates the tile's visual from its stored state. Subclasses will extend this.
+        Prefer TileSurfacePool.acquire(), which only renders each visual state once."""
+        return pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
+
+# Subclasses
+
 class GroundTile(Tile):
     """Tile containing all farming logic."""
-    def __init__(self, level: Level, x: Num, y: Num, tile_type_key: str, neighbors: list[bool], 
-                 group: Group, detail_image: pygame.Surface | None = None) -> None:    
-        # Call the parent __init__ to set up position and visuals
-        super().__init__(level, x, y, tile_type_key, neighbors, group, detail_image)
-        self.is_tilled = False
-        self.tillable = (tile_type_key in ["GRASS_A", "GRASS_B", "DIRT"])
-        self.watered = False
+    __slots__ = ()
+
+    @property
+    def visual_key(self) -> tuple:
+        store, index = self.store, self.index
+        mask = store.masks[index]
+        flags = store.flags[index] & (TileStore.TILLED | TileStore.WATERED)
         
-    def refresh_terrain(self, new_neighbors: list[bool]) -> None:
+        # Grass variants are picked per position, so key on the picks (not the position) to keep sharing
+        picks: tuple[int, ...] = ()
+        if mask:
+            grid_x, grid_y, seed = self.grid_x, self.grid_y, self.level.seed
+            picks = tuple(LAYOUT.get_variant_index(quad_mask, seed, grid_x, grid_y, quad)
+                          for quad, quad_mask in enumerate(QUAD_MASKS[mask]))
+        return (store.types[index], mask, flags, store.details[index], picks)
+
+    def render(self) -> pygame.Surface:
         # LAYER 1: Base Dirt Background
         dirt_img = ASSETS.get_image("DIRT_IMAGE")
-        self.base_image = dirt_img.copy() if dirt_img else pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
-        if not dirt_img: 
-            self.base_image.fill((139, 69, 19)) # Fallback brown
-        
+        image = dirt_img.copy() if dirt_img else pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
+        if not dirt_img:
+            image.fill((139, 69, 19)) # Fallback brown
+
         # LAYER 2: Draw farming overlays (Tilled soil) BEFORE the grass!
         # This allows the grass to curve perfectly over the edges of your tilled dirt.
         if self.is_tilled:
             tilled_img = ASSETS.get_image("tilled_soil")
             if tilled_img:
-                self.base_image.blit(tilled_img, tilled_img.get_rect(center=(BLOCK_SIZE//2, BLOCK_SIZE//2)))
+                image.blit(tilled_img, tilled_img.get_rect(center=(BLOCK_SIZE//2, BLOCK_SIZE//2)))
 
-        # LAYER 3: Draw the Grass marching squares OVER the dirt and tilled soil
-        if any(new_neighbors) and self.tile_type_key != "WATER":
-            grass_key = self.tile_type_key if "GRASS" in self.tile_type_key else "GRASS_A"
-            # Assumes GRASS_LAYOUT is imported/available!
-            grass_overlay = ASSETS.autotile(grass_key, LAYOUT, new_neighbors)
-            self.base_image.blit(grass_overlay, (0, 0))
+            if self.watered:
+                wet_overlay = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE), pygame.SRCALPHA)
+                wet_overlay.fill(ASSETS.colour("WATERED"))
+                image.blit(wet_overlay, (0, 0))
 
-        self.image = self.base_image.copy()
+        # LAYER 3: Draw the Grass marching squares OVER the dirt and tilled soil
+        mask = self.mask
+        if mask:
+            tile_type_key = self.tile_type_key
+            grass_key = tile_type_key if "GRASS" in tile_type_key else "GRASS_A"
+            grass_overlay = ASSETS.autotile(grass_key, LAYOUT, mask,
+                                            self.level.seed, (self.grid_x, self.grid_y))
+            image.blit(grass_overlay, (0, 0))
 
         # LAYER 4: Draw static details (Pebbles, flowers, etc.) ON TOP of everything
-        if self.detail_image and not self.is_tilled:
-            detail_rect = self.detail_image.get_rect(center=(BLOCK_SIZE // 2, BLOCK_SIZE // 2))
-            self.image.blit(self.detail_image, detail_rect)
+        detail_image = self.detail_image
+        if detail_image and not self.is_tilled:
+            detail_rect = detail_image.get_rect(center=(BLOCK_SIZE // 2, BLOCK_SIZE // 2))
+            image.blit(detail_image, detail_rect)
+
+        return image
 
 class WaterTile(Tile):
     """Tile representing water. Blocks movement."""
-    def __init__(self, level: Level, x: Num, y: Num, tile_type_key: str, neighbors: list[bool], 
-                 group: Group, detail_image: pygame.Surface | None = None) -> None:
-        super().__init__(level, x, y, tile_type_key, neighbors, group, detail_image)
-        self._base_obstructed = True
-        
-        
-    def refresh_terrain(self, new_neighbors: list[bool]) -> None:
-        # A simple, static block of water.
-        self.base_image = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
-        self.base_image.fill((56, 220, 245)) # Cyan Water
-        self.image = self.base_image.copy()
+    __slots__ = ()
 
+    def render(self) -> pygame.Surface:
+        # A simple, static block of water.
+        image = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
+        image.fill((56, 220, 245)) # Cyan Water
+        return image
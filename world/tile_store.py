@@ -0,0 +1,107 @@
+from __future__ import annotations
+from array import array
+from typing import TYPE_CHECKING, Any
+
+# Type-Only Imports
+if TYPE_CHECKING:
+    from entities.entity import Entity
+
+class TileStore:
+    """ Struct-of-arrays backing store for every tile in a level.
+    Each attribute lives in its own flat typed array, indexed by (grid_y * width + grid_x),
+    so a tile costs a handful of bytes instead of a full Sprite with its own surfaces.
+    world.tile.Tile objects are lightweight views onto one index, created on demand. """
+
+    # Tile types (the array stores the index into this tuple)
+    TYPE_KEYS: tuple[str, ...] = ("DIRT", "GRASS_A", "GRASS_B", "WATER")
+    TYPE_IDS: dict[str, int] = {key: i for i, key in enumerate(TYPE_KEYS)}
+
+    # Bit flags
+    TILLABLE = 1
+    TILLED = 2
+    WATERED = 4
+    OBSTRUCTED = 8
+
+    NO_OCCUPANT = 0
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        size = width * height
+
+        self.types = array("B", [0]) * size     # Index into TYPE_KEYS
+        self.flags = array("B", [0]) * size     # TILLABLE | TILLED | WATERED | OBSTRUCTED
+        self.masks = array("H", [0]) * size     # 9-bit grass mask
+        self.details = array("H", [0]) * size   # Detail image index + 1 (0 = no detail)
+        self.occupants = array("I", [0]) * size # Occupant ID (0 = empty)
+
+        # Occupant IDs map back to the live entities (released once no tile uses them)
+        self._entities: dict[int, Entity] = {}
+        self._entity_ids: dict[int, int] = {} # id(entity) -> occupant ID
+        self._tile_counts: dict[int, int] = {} # occupant ID -> tiles it occupies
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the tile arrays (not counting the occupant lookup)."""
+        return sum(arr.itemsize * len(arr) for arr in (self.types, self.flags, self.masks, self.details, self.occupants))
+
+    def index(self, grid_x: int, grid_y: int) -> int | None:
+        """Flat array index for a grid coordinate, or None if it's off the map."""
+        if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+            return grid_y * self.width + grid_x
+        return None
+
+    def load_grid(self, column: array, grid: Any) -> None:
+        """Bulk-copies a whole-map grid (a 2D NumPy array or a list of rows) into one of the arrays."""
+        if hasattr(grid, "astype"): # NumPy: copy the raw bytes straight across
+            column[:] = array(column.typecode, grid.astype(column.typecode).tobytes())
+        else:
+            column[:] = array(column.typecode, (value for row in grid for value in row))
+
+    # --- FLAGS ---
+    def has_flag(self, index: int, flag: int) -> bool:
+        return bool(self.flags[index] & flag)
+
+    def set_flag(self, index: int, flag: int, value: bool) -> None:
+        if value:
+            self.flags[index] |= flag
+        else:
+            self.flags[index] &= ~flag & 0xFF
+
+    # --- OCCUPANTS ---
+    def get_occupant(self, index: int) -> Entity | None:
+        return self._entities.get(self.occupants[index])
+
+    def set_occupant(self, index: int, entity: Entity | None) -> None:
+        """Stores an entity against a tile by ID. Passing None clears the tile."""
+        old_id = self.occupants[index]
+        if old_id != self.NO_OCCUPANT:
+            if self._entities[old_id] is entity:
+                return
+            self._release(old_id)
+
+        if entity is None:
+            self.occupants[index] = self.NO_OCCUPANT
+            return
+
+        occupant_id = self._entity_ids.get(id(entity))
+        if occupant_id is None:
+            occupant_id = self._next_id
+            self._next_id += 1
+            self._entity_ids[id(entity)] = occupant_id
+            self._entities[occupant_id] = entity
+        self._tile_counts[occupant_id] = self._tile_counts.get(occupant_id, 0) + 1
+        self.occupants[index] = occupant_id
+
+    def _release(self, occupant_id: int) -> None:
+        """Drops one tile's use of an occupant ID, forgetting the entity once no tile uses it."""
+        count = self._tile_counts[occupant_id] - 1
+        if count:
+            self._tile_counts[occupant_id] = count
+            return
+        del self._tile_counts[occupant_id]
+        del self._entity_ids[id(self._entities.pop(occupant_id))]